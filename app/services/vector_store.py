@@ -1,3 +1,4 @@
+import functools
 import logging
 import numpy as np
 import faiss
@@ -11,8 +12,53 @@ from datetime import datetime
 from app.config import settings
 from app.services.embeddings import embedding_service
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Metadata keys that are unique per chunk or free text, so never worth indexing for filters
+UNINDEXED_METADATA_KEYS = frozenset({"text", "chunk_id", "added_at"})
+
+@functools.lru_cache(maxsize=1024)
+def _cached_embed(query: str) -> bytes:
+    """Embed a query once per distinct string; arrays are unhashable, so cache the raw bytes."""
+    return embedding_service.embed_single(query).astype(np.float32).tobytes()
+
+# Embedding model the cached vectors were computed with
+_cached_embed_model = None
+
+def _embed_query(query: str) -> np.ndarray:
+    """
+    Get the (1, dimension) embedding for a search query, served from an LRU cache.
+
+    The cache is cleared whenever embedding_service.model has been replaced.
+    """
+    global _cached_embed_model
+    model = embedding_service.model
+    if model is not _cached_embed_model:
+        _cached_embed.cache_clear()
+        _cached_embed_model = model
+    return np.frombuffer(_cached_embed(query), dtype=np.float32).reshape(1, -1)
+
+def _write_info(path: Path, info: Dict[str, Any]):
+    """Write a collection info file, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        path.write_bytes(orjson.dumps(info, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(info, f, indent=2)
+
+def _read_info(path: Path) -> Dict[str, Any]:
+    """Read a collection info file, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r') as f:
+        return json.load(f)
+
 class VectorStore:
     """Manages FAISS vector stores for different document collections."""
 
@@ -27,6 +73,8 @@ class VectorStore:
         self.collection_id = str(uuid.uuid4())[:8]
         self.index = None
         self.metadata = []
+        self.id_to_metadata = {}  # FAISS id -> chunk metadata
+        self.filter_index = {}  # metadata key -> value -> set of FAISS ids
         self.dimension = embedding_service.dimension
         self.is_trained = False
         self.total_chunks = 0
@@ -58,6 +106,59 @@ class VectorStore:
             logger.error(f"Failed to create FAISS index: {e}")
             raise RuntimeError(f"Could not create vector index: {str(e)}")
 
+    def _register_metadata(self, faiss_id: int, meta: Dict[str, Any]):
+        """Track chunk metadata by FAISS id and index its filterable values."""
+        self.id_to_metadata[faiss_id] = meta
+        for key, value in meta.items():
+            if key in UNINDEXED_METADATA_KEYS:
+                continue
+            try:
+                self.filter_index.setdefault(key, {}).setdefault(value, set()).add(faiss_id)
+            except TypeError:
+                # Unhashable values (lists, dicts) are only filterable in Python
+                continue
+
+    def _unregister_metadata(self, faiss_id: int):
+        """Drop a chunk from the metadata lookups."""
+        meta = self.id_to_metadata.pop(faiss_id, None)
+        if meta is None:
+            return
+        for key, value in meta.items():
+            try:
+                ids = self.filter_index.get(key, {}).get(value)
+            except TypeError:
+                continue
+            if ids is not None:
+                ids.discard(faiss_id)
+
+    def _allowed_ids(self, filters: Dict[str, Any]) -> Optional[np.ndarray]:
+        """
+        Resolve metadata filters to the FAISS ids that satisfy them.
+
+        Matches the Python post-filter semantics: a chunk passes a filter
+        when it lacks the key or has an equal value. Returns None when a
+        filter cannot be answered from the index.
+        """
+        allowed = set(self.id_to_metadata)
+        for key, value in filters.items():
+            if key in UNINDEXED_METADATA_KEYS:
+                return None
+
+            values = self.filter_index.get(key)
+            if not values:
+                continue
+
+            try:
+                hash(value)
+            except TypeError:
+                return None
+
+            for other_value, ids in values.items():
+                if other_value != value:
+                    allowed.difference_update(ids)
+
+        return np.fromiter(allowed, dtype=np.int64, count=len(allowed))
+
     def add_texts(
         self, 
         chunks: List[Dict[str, Any]], 
@@ -85,6 +186,7 @@ class VectorStore:
 
             texts_to_embed.append(chunk["text"])
             self.metadata.append(chunk)
+            self._register_metadata(int(chunk_id[:8], 16), chunk)
             chunk_ids.append(chunk_id)
 
         # Embed in batches to avoid memory issues
@@ -119,26 +221,86 @@ class VectorStore:
         """
         Search for similar chunks to the query.
         """
-        if self.index is None or self.total_chunks == 0:
+        if k <= 0 or self.index is None or self.total_chunks == 0:
+            return []
+
+        # Generate query embedding
+        query_embedding = _embed_query(query)
+
+        return self.similarity_search_embedded(query_embedding, k, score_threshold)
+
+    def similarity_search_embedded(
+        self,
+        query_embedding: np.ndarray,
+        k: int = 5,
+        score_threshold: float = 0.5,
+        allowed_ids: Optional[np.ndarray] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Search for similar chunks using a precomputed query embedding.
+
+        When allowed_ids is given, only those FAISS ids are scored.
+        """
+        if k <= 0 or self.index is None or self.total_chunks == 0:
             return []
 
         # Limit k to available chunks
         k = min(k, self.total_chunks)
 
         try:
-            # Generate query embedding
-            query_embedding = embedding_service.embed_single(query)
-
             # Search
-            scores, indices = self.index.search(query_embedding, k)
+            if allowed_ids is not None:
+                k = min(k, len(allowed_ids))
+                selector = faiss.IDSelectorBatch(len(allowed_ids), faiss.swig_ptr(allowed_ids))
+                params = faiss.SearchParameters(sel=selector)
+                scores, indices = self.index.search(query_embedding, k, params=params)
+            else:
+                scores, indices = self.index.search(query_embedding, k)
 
             results = []
             for score, idx in zip(scores[0], indices[0]):
-                if idx == -1 or score  List[Dict[str, Any]]:
+                if idx == -1 or score < score_threshold:
+                    continue
+
+                meta = self.id_to_metadata.get(int(idx))
+                if meta is None:
+                    continue
+
+                result = dict(meta)
+                result["similarity_score"] = float(score)
+                results.append(result)
+
+            return results
+
+        except Exception as e:
+            logger.error(f"Similarity search failed: {e}")
+            return []
+
+    def search_with_filters(
+        self,
+        query: str,
+        k: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        score_threshold: float = 0.5
+    ) -> List[Dict[str, Any]]:
         """
         Search with metadata filters.
         """
-        # First get regular search results
+        if not filters:
+            return self.similarity_search(query, k, score_threshold)
+
+        # Push the filters down into FAISS when the metadata index can answer them
+        allowed_ids = self._allowed_ids(filters)
+        if allowed_ids is not None:
+            if k <= 0 or len(allowed_ids) == 0 or self.index is None:
+                return []
+
+            query_embedding = _embed_query(query)
+            return self.similarity_search_embedded(
+                query_embedding, k, score_threshold, allowed_ids=allowed_ids
+            )
+
+        # Otherwise over-fetch and filter in Python
         results = self.similarity_search(query, k * 2, score_threshold)
 
         if not filters or not results:
@@ -185,6 +347,8 @@ class VectorStore:
             meta for meta in self.metadata 
             if meta.get("chunk_id") not in chunk_ids
         ]
+        for faiss_id in ids_to_remove:
+            self._unregister_metadata(faiss_id)
 
         deleted_count = initial_count - len(self.metadata)
         self.total_chunks -= deleted_count
@@ -213,8 +377,7 @@ class VectorStore:
                 "updated_at": datetime.utcnow().isoformat()
             }
 
-            with open(self.info_file, 'w') as f:
-                json.dump(info, f, indent=2)
+            _write_info(self.info_file, info)
 
             logger.info(f"Saved vector store for collection: {self.collection_name}")
 
@@ -235,12 +398,16 @@ class VectorStore:
             if self.metadata_file.exists():
                 with open(self.metadata_file, 'rb') as f:
                     self.metadata = pickle.load(f)
+                self.id_to_metadata = {}
+                self.filter_index = {}
+                for meta in self.metadata:
+                    if meta.get("chunk_id"):
+                        self._register_metadata(int(meta["chunk_id"][:8], 16), meta)
 
             # Load info
             if self.info_file.exists():
-                with open(self.info_file, 'r') as f:
-                    info = json.load(f)
-                    self.total_chunks = info.get("total_chunks", 0)
+                info = _read_info(self.info_file)
+                self.total_chunks = info.get("total_chunks", 0)
 
             self.is_trained = True
             logger.info(f"Loaded vector store for collection: {self.collection_name}")
@@ -278,15 +445,14 @@ class VectorStoreManager:
                 info_file = collection_dir / "info.json"
                 if info_file.exists():
                     try:
-                        with open(info_file, 'r') as f:
-                            info = json.load(f)
-                            collection_name = info.get("collection_name")
-
-                            if collection_name:
-                                store = VectorStore(collection_name)
-                                if store.load():
-                                    self.stores[collection_name] = store
-                                    logger.info(f"Loaded existing vector store: {collection_name}")
+                        info = _read_info(info_file)
+                        collection_name = info.get("collection_name")
+
+                        if collection_name:
+                            store = VectorStore(collection_name)
+                            if store.load():
+                                self.stores[collection_name] = store
+                                logger.info(f"Loaded existing vector store: {collection_name}")
                     except Exception as e:
                         logger.error(f"Failed to load store from {collection_dir}: {e}")
 
@@ -338,13 +504,22 @@ class VectorStoreManager:
         if collection_names is None:
             collection_names = list(self.stores.keys())
 
+        stores = [
+            self.stores[name] for name in collection_names
+            if name in self.stores and self.stores[name].total_chunks > 0
+        ]
+        if k_per_collection <= 0 or not stores:
+            return []
+
+        # Embed the query once and reuse it for every collection
+        query_embedding = _embed_query(query)
+
         all_results = []
-        for collection_name in collection_names:
-            if collection_name in self.stores:
-                results = self.stores[collection_name].similarity_search(
-                    query, k_per_collection, score_threshold
-                )
-                all_results.extend(results)
+        for store in stores:
+            results = store.similarity_search_embedded(
+                query_embedding, k_per_collection, score_threshold
+            )
+            all_results.extend(results)
 
         # Sort by similarity score
         all_results.sort(key=lambda x: x.get("similarity_score", 0), reverse=True)
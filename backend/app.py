@@ -4,22 +4,35 @@ Core application with REST API endpoints and WebSocket handling for real-time co
 """
 
 import asyncio
-import json
 import logging
+import os
+import time
 import uuid
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Set, Tuple
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Depends, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field, validator
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field, validator
+import orjson
 import redis.asyncio as redis
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
-from sqlalchemy import Column, String, Text, DateTime, JSON, Integer, Boolean
-import aioredis
+from sqlalchemy import (
+    Column, String, Text, DateTime, JSON, Integer, Boolean, ForeignKey, Index,
+    select, delete, func, text, event, bindparam
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(
@@ -27,10 +40,36 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
+logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+
+# uvloop's libuv-based loop cuts per-await and per-syscall overhead on the WebSocket path
+if UVLOOP_AVAILABLE:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 # Database configuration
 DATABASE_URL = "sqlite+aiosqlite:///./codecraft.db"
-engine = create_async_engine(DATABASE_URL, echo=True, future=True)
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=bool(os.getenv("SQL_DEBUG")),
+    future=True,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=5,
+    max_overflow=10,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    query_cache_size=1200
+)
+
+@event.listens_for(engine.sync_engine, "connect")
+def configure_sqlite_connection(dbapi_connection, connection_record):
+    """Apply SQLite pragmas once per pooled connection so WAL and the page cache persist"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
 AsyncSessionLocal = async_sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
@@ -38,7 +77,18 @@ Base = declarative_base()
 
 # Redis configuration for pub/sub and caching
 REDIS_URL = "redis://localhost:6379"
-redis_pool = None
+REDIS_PROJECT_CHANNEL_PREFIX = "proj:"
+redis_pool: Optional[redis.ConnectionPool] = None
+
+# CORS: exact origins let the middleware do a set lookup instead of wildcard handling
+ALLOWED_ORIGINS = frozenset(
+    origin.strip()
+    for origin in os.getenv(
+        "CORS_ORIGINS",
+        "http://localhost,http://localhost:3000,http://localhost:8000"
+    ).split(",")
+    if origin.strip()
+)
 
 # Pydantic models for request/response
 class ProjectCreate(BaseModel):
@@ -69,6 +119,8 @@ class WebSocketMessage(BaseModel):
 
 class ProjectResponse(BaseModel):
     """Response model for project data"""
+    model_config = ConfigDict(from_attributes=True)
+    
     id: str
     name: str
     description: Optional[str]
@@ -80,6 +132,8 @@ class ProjectResponse(BaseModel):
 
 class FileResponse(BaseModel):
     """Response model for file data"""
+    model_config = ConfigDict(from_attributes=True)
+    
     id: str
     path: str
     content: str
@@ -93,6 +147,10 @@ class FileResponse(BaseModel):
 class Project(Base):
     """Project database model"""
     __tablename__ = "projects"
+    __table_args__ = (
+        # Serves get_projects' ORDER BY updated_at DESC (SQLite scans it backwards)
+        Index("ix_projects_updated", "updated_at"),
+    )
     
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     name = Column(String(100), nullable=False)
@@ -105,38 +163,243 @@ class Project(Base):
 class File(Base):
     """File database model"""
     __tablename__ = "files"
+    __table_args__ = (
+        # Serves get_project_files' WHERE project_id ORDER BY path and the create_file upsert
+        Index("ix_files_project_path", "project_id", "path", unique=True),
+    )
     
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     path = Column(String(500), nullable=False)
     content = Column(Text, nullable=False)
     purpose = Column(Text, nullable=False)
     version = Column(Integer, default=0, nullable=False)
-    project_id = Column(String, nullable=False)
+    project_id = Column(String, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+# Statements are built once at import so SQLAlchemy's compiled-statement cache always hits
+_Q_LIST_PROJECTS = (
+    select(Project, func.count(File.id).label("file_count"))
+    .outerjoin(File, File.project_id == Project.id)
+    .group_by(Project.id)
+    .order_by(Project.updated_at.desc())
+)
+_Q_GET_PROJECT = (
+    select(Project, func.count(File.id).label("file_count"))
+    .outerjoin(File, File.project_id == Project.id)
+    .where(Project.id == bindparam("project_id"))
+    .group_by(Project.id)
+)
+_Q_PROJECT_EXISTS = text("SELECT id FROM projects WHERE id = :project_id")
+_Q_DELETE_PROJECT = (
+    delete(Project)
+    .where(Project.id == bindparam("project_id"))
+    .returning(Project.id)
+    .execution_options(synchronize_session=False)
+)
+_Q_PROJECT_FILES = (
+    select(File.__table__)
+    .where(File.project_id == bindparam("project_id"))
+    .order_by(File.path)
+)
+_Q_INSERT_FILE = (
+    sqlite_insert(File.__table__)
+    .on_conflict_do_nothing(index_elements=["project_id", "path"])
+    .returning(File.__table__.c.id)
+)
+
+def now_ms() -> int:
+    """Current epoch time in milliseconds, used as the WebSocket message timestamp"""
+    return time.time_ns() // 1_000_000
+
+def encode_message(message: Any) -> str:
+    """Serialize a WebSocket message with orjson; naive datetimes are tagged as UTC"""
+    return orjson.dumps(message, option=orjson.OPT_NAIVE_UTC).decode()
+
+# Sentinel that tells a connection writer to flush and stop
+_CLOSE_WRITER = None
+
+# Per-connection send queue bounds
+SEND_QUEUE_MAXSIZE = 256
+SEND_QUEUE_MAX_OVERFLOWS = 64
+
+class SendQueue(asyncio.Queue):
+    """Bounded per-connection send queue that drops its oldest message when full"""
+    
+    def __init__(self, project_id: str, user_id: str):
+        super().__init__(maxsize=SEND_QUEUE_MAXSIZE)
+        self.project_id = project_id
+        self.user_id = user_id
+        self.overflow_streak = 0
+    
+    def offer(self, message: Any) -> bool:
+        """Queue a message, evicting the oldest one if full; False once the client is persistently backlogged"""
+        if self.full():
+            self.get_nowait()
+            self.overflow_streak += 1
+        else:
+            self.overflow_streak = 0
+        self.put_nowait(message)
+        return self.overflow_streak < SEND_QUEUE_MAX_OVERFLOWS
+
 class ConnectionManager:
     """Manager for WebSocket connections"""
     
     def __init__(self):
-        self.active_connections: Dict[str, Dict[str, WebSocket]] = {}
-        self.user_projects: Dict[str, Set[str]] = {}
+        # Flat (project_id, user_id) -> socket map for O(1) membership and disconnect
+        self.sockets: Dict[Tuple[str, str], WebSocket] = {}
+        # Per-project parallel arrays (users[i] owns sockets[i] and queues[i]), kept dense by swap-pop
+        self.project_users: Dict[str, List[str]] = {}
+        self.project_sockets: Dict[str, List[WebSocket]] = {}
+        self.project_queues: Dict[str, List[SendQueue]] = {}
+        self.slots: Dict[Tuple[str, str], int] = {}
+        self.send_queues: Dict[WebSocket, SendQueue] = {}
+        self.writer_tasks: Dict[WebSocket, asyncio.Task] = {}
+        # Pre-rendered JSON head of each connection's cursor_update frame, up to the "data" value
+        self.cursor_prefixes: Dict[Tuple[str, str], str] = {}
+        # Edits received within one event-loop turn, per (project_id, user_id), awaiting a flush
+        self.edit_buffers: Dict[Tuple[str, str], List[dict]] = {}
+        self.redis = None
         self.redis_pubsub = None
+        self.pubsub_task: Optional[asyncio.Task] = None
+        # Created in start_pubsub: on Python 3.9 a Queue binds to the loop current at construction
+        self.publish_queue: Optional[asyncio.Queue] = None
+        self.publisher_task: Optional[asyncio.Task] = None
+        self.background_tasks: Set[asyncio.Task] = set()
+    
+    async def start_pubsub(self, redis_client):
+        """Subscribe to project channels so broadcasts reach sockets on every worker process"""
+        try:
+            pubsub = redis_client.pubsub()
+            await pubsub.psubscribe(f"{REDIS_PROJECT_CHANNEL_PREFIX}*")
+        except Exception as e:
+            logger.warning(f"Redis pub/sub unavailable, broadcasting to local connections only: {e}")
+            return
+        
+        self.redis = redis_client
+        self.redis_pubsub = pubsub
+        self.publish_queue = asyncio.Queue()
+        self.pubsub_task = asyncio.create_task(self._pubsub_listener(pubsub))
+        self.publisher_task = asyncio.create_task(self._publisher())
+    
+    async def stop_pubsub(self):
+        """Stop relaying project broadcasts from Redis"""
+        pubsub = self.redis_pubsub
+        self.redis_pubsub = None
+        
+        for task in (self.pubsub_task, self.publisher_task):
+            if task is not None:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+        self.pubsub_task = None
+        self.publisher_task = None
+        
+        if pubsub is not None:
+            try:
+                await pubsub.punsubscribe()
+                await pubsub.close()
+            except Exception as e:
+                logger.error(f"Error closing Redis pub/sub: {e}")
+    
+    async def _pubsub_listener(self, pubsub):
+        """Relay messages published by any worker to this process's local sockets"""
+        try:
+            async for item in pubsub.listen():
+                if item["type"] != "pmessage":
+                    continue
+                
+                channel = item["channel"]
+                if isinstance(channel, bytes):
+                    channel = channel.decode()
+                project_id = channel[len(REDIS_PROJECT_CHANNEL_PREFIX):]
+                
+                data = item["data"]
+                if isinstance(data, bytes):
+                    data = data.decode()
+                header, _, payload = data.partition("\n")
+                self._deliver_local(project_id, orjson.loads(header), payload or None)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Redis pub/sub listener stopped, falling back to local broadcasts: {e}")
+            self.redis_pubsub = None
+    
+    def _spawn(self, coro):
+        """Run a coroutine in the background, keeping a reference until it finishes"""
+        task = asyncio.create_task(coro)
+        self.background_tasks.add(task)
+        task.add_done_callback(self.background_tasks.discard)
+    
+    def _deliver_local(self, project_id: str, header: dict, payload: Optional[str]):
+        """Apply a published broadcast to this process's sockets"""
+        if header.get("close"):
+            # Closing waits on slow sockets, so keep it off the caller's loop
+            self._spawn(self._close_local(project_id, payload))
+        else:
+            self._broadcast_local(project_id, payload, header.get("exclude_user"))
+    
+    async def _publish(self, project_id: str, header: dict, payload: Optional[str]) -> bool:
+        """Queue a serialized broadcast for every worker; returns False if Redis is unavailable"""
+        if self.redis_pubsub is None:
+            return False
+        
+        self.publish_queue.put_nowait((project_id, header, payload))
+        return True
+    
+    async def _publisher(self):
+        """Drain queued publishes and send each event-loop turn's worth in one pipeline"""
+        while True:
+            batch = [await self.publish_queue.get()]
+            # Yield once so publishes issued in the same loop turn join this batch
+            await asyncio.sleep(0)
+            while True:
+                try:
+                    batch.append(self.publish_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            
+            try:
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    for project_id, header, payload in batch:
+                        # Wire format: small JSON header, newline, then the already-serialized message
+                        pipe.publish(
+                            f"{REDIS_PROJECT_CHANNEL_PREFIX}{project_id}",
+                            f"{encode_message(header)}\n{payload or ''}"
+                        )
+                    await pipe.execute()
+            except Exception as e:
+                logger.error(f"Error publishing {len(batch)} broadcasts, delivering locally: {e}")
+                for project_id, header, payload in batch:
+                    self._deliver_local(project_id, header, payload)
         
     async def connect(self, websocket: WebSocket, project_id: str, user_id: str):
         """Connect a user to a project room"""
         await websocket.accept()
         
-        if project_id not in self.active_connections:
-            self.active_connections[project_id] = {}
+        key = (project_id, user_id)
+        if key in self.sockets:
+            # Replace a stale connection for the same user
+            self.disconnect(project_id, user_id)
         
-        self.active_connections[project_id][user_id] = websocket
+        # Outgoing messages go through a per-connection queue drained by a writer task
+        queue = SendQueue(project_id, user_id)
+        self.sockets[key] = websocket
+        self.send_queues[websocket] = queue
+        self.writer_tasks[websocket] = asyncio.create_task(
+            self._writer(websocket, queue, project_id, user_id)
+        )
         
-        if user_id not in self.user_projects:
-            self.user_projects[user_id] = set()
-        self.user_projects[user_id].add(project_id)
+        users = self.project_users.setdefault(project_id, [])
+        self.slots[key] = len(users)
+        users.append(user_id)
+        self.project_sockets.setdefault(project_id, []).append(websocket)
+        self.project_queues.setdefault(project_id, []).append(queue)
+        self.cursor_prefixes[key] = (
+            '{"type":"cursor_update","project_id":' + orjson.dumps(project_id).decode()
+            + ',"user_id":' + orjson.dumps(user_id).decode() + ',"data":'
+        )
         
-        logger.info(f"User {user_id} connected to project {project_id}")
+        logger.debug(f"User {user_id} connected to project {project_id}")
         
         # Notify others in the project
         await self.broadcast_to_project(
@@ -145,8 +408,8 @@ class ConnectionManager:
                 "type": "user_joined",
                 "user_id": user_id,
                 "project_id": project_id,
-                "timestamp": datetime.utcnow().isoformat(),
-                "active_users": list(self.active_connections[project_id].keys())
+                "timestamp": now_ms(),
+                "active_users": self.active_users(project_id)
             },
             exclude_user=user_id
         )
@@ -156,79 +419,242 @@ class ConnectionManager:
             {
                 "type": "project_state",
                 "project_id": project_id,
-                "active_users": list(self.active_connections[project_id].keys()),
-                "timestamp": datetime.utcnow().isoformat()
+                "active_users": self.active_users(project_id),
+                "timestamp": now_ms()
             },
             websocket
         )
     
     def disconnect(self, project_id: str, user_id: str):
         """Disconnect a user from a project room"""
-        if project_id in self.active_connections:
-            if user_id in self.active_connections[project_id]:
-                del self.active_connections[project_id][user_id]
-                logger.info(f"User {user_id} disconnected from project {project_id}")
-                
-                # Clean up empty projects
-                if not self.active_connections[project_id]:
-                    del self.active_connections[project_id]
+        key = (project_id, user_id)
+        websocket = self.sockets.pop(key, None)
+        if websocket is None:
+            return
+        
+        # Swap-pop: move the last slot into the vacated one so removal is O(1)
+        slot = self.slots.pop(key)
+        self.cursor_prefixes.pop(key, None)
+        users = self.project_users[project_id]
+        sockets = self.project_sockets[project_id]
+        queues = self.project_queues[project_id]
+        last = len(users) - 1
+        if slot != last:
+            users[slot] = users[last]
+            sockets[slot] = sockets[last]
+            queues[slot] = queues[last]
+            self.slots[(project_id, users[slot])] = slot
+        users.pop()
+        sockets.pop()
+        queues.pop()
+        
+        # Clean up empty projects
+        if not users:
+            del self.project_users[project_id]
+            del self.project_sockets[project_id]
+            del self.project_queues[project_id]
         
-        if user_id in self.user_projects:
-            self.user_projects[user_id].discard(project_id)
-            if not self.user_projects[user_id]:
-                del self.user_projects[user_id]
+        queue = self.send_queues.pop(websocket, None)
+        if queue is not None:
+            queue.offer(_CLOSE_WRITER)
+        logger.debug(f"User {user_id} disconnected from project {project_id}")
+    
+    def active_users(self, project_id: str) -> List[str]:
+        """List the users connected to a project on this worker"""
+        return list(self.project_users.get(project_id, ()))
+    
+    def _drop_backlogged(self, queue: SendQueue):
+        """Disconnect and close a client that keeps overflowing its send queue"""
+        websocket = self.sockets.get((queue.project_id, queue.user_id))
+        logger.warning(
+            f"Dropping backlogged connection for user {queue.user_id} in project {queue.project_id}"
+        )
+        self.disconnect(queue.project_id, queue.user_id)
+        if websocket is not None:
+            self._spawn(websocket.close())
+    
+    async def _writer(self, websocket: WebSocket, queue: SendQueue, project_id: str, user_id: str):
+        """Drain a connection's queue, sending each burst of messages as a single frame"""
+        try:
+            while True:
+                batch = [await queue.get()]
+                while True:
+                    try:
+                        batch.append(queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+                
+                closing = _CLOSE_WRITER in batch
+                if closing:
+                    batch = batch[:batch.index(_CLOSE_WRITER)]
+                
+                if batch:
+                    # A lone message keeps its plain object shape; bursts go out as a JSON array
+                    await websocket.send_text(
+                        batch[0] if len(batch) == 1 else "[" + ",".join(batch) + "]"
+                    )
+                
+                if closing:
+                    return
+        except Exception as e:
+            logger.error(f"Error sending to user {user_id} in project {project_id}: {e}")
+            if self.sockets.get((project_id, user_id)) is websocket:
+                self.disconnect(project_id, user_id)
+        finally:
+            self.writer_tasks.pop(websocket, None)
     
     async def send_personal_message(self, message: dict, websocket: WebSocket):
         """Send a message to a specific WebSocket connection"""
+        payload = encode_message(message)
+        queue = self.send_queues.get(websocket)
+        if queue is not None:
+            if not queue.offer(payload):
+                self._drop_backlogged(queue)
+            return
+        
         try:
-            await websocket.send_json(message)
+            await websocket.send_text(payload)
         except Exception as e:
             logger.error(f"Error sending personal message: {e}")
     
-    async def broadcast_to_project(self, project_id: str, message: dict, exclude_user: str = None):
-        """Broadcast a message to all connections in a project"""
-        if project_id not in self.active_connections:
+    async def broadcast_to_project(
+        self,
+        project_id: str,
+        message: dict,
+        exclude_user: str = None,
+        publish: bool = True
+    ):
+        """Broadcast a message to all connections in a project, across workers when Redis is up"""
+        # Serialize once; every recipient (and every worker) shares the same payload
+        await self._broadcast_payload(project_id, encode_message(message), exclude_user, publish)
+    
+    async def _broadcast_payload(
+        self,
+        project_id: str,
+        payload: str,
+        exclude_user: str = None,
+        publish: bool = True
+    ):
+        """Broadcast an already-serialized message to a project"""
+        if publish and await self._publish(project_id, {"exclude_user": exclude_user}, payload):
             return
         
-        disconnected_users = []
+        self._broadcast_local(project_id, payload, exclude_user)
+    
+    def _broadcast_local(self, project_id: str, payload: str, exclude_user: str = None):
+        """Queue a serialized message for this process's connections in a project"""
+        queues = self.project_queues.get(project_id)
+        if not queues:
+            return
         
-        for user_id, connection in self.active_connections[project_id].items():
-            if user_id == exclude_user:
-                continue
-            
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"Error broadcasting to user {user_id}: {e}")
-                disconnected_users.append(user_id)
+        skip = self.slots.get((project_id, exclude_user)) if exclude_user is not None else None
+        # Collect before dropping: _drop_backlogged swap-pops these arrays
+        backlogged = [queue for i, queue in enumerate(queues) if i != skip and not queue.offer(payload)]
+        for queue in backlogged:
+            self._drop_backlogged(queue)
+    
+    async def close_project(self, project_id: str, message: Optional[dict] = None, publish: bool = True):
+        """Send a final message to a project room, then close every socket in it concurrently"""
+        payload = encode_message(message) if message is not None else None
+        
+        if publish and await self._publish(project_id, {"close": True}, payload):
+            return
         
-        # Clean up disconnected users
-        for user_id in disconnected_users:
+        await self._close_local(project_id, payload)
+    
+    async def _close_local(self, project_id: str, payload: Optional[str] = None):
+        """Flush a final payload to this process's sockets in a project, then close them"""
+        if project_id not in self.project_users:
+            return
+        
+        if payload is not None:
+            self._broadcast_local(project_id, payload)
+        
+        websockets = list(self.project_sockets[project_id])
+        writers = [self.writer_tasks[ws] for ws in websockets if ws in self.writer_tasks]
+        
+        for user_id in self.active_users(project_id):
             self.disconnect(project_id, user_id)
+        
+        # Let every writer flush its queue, then close the sockets, all in parallel
+        await asyncio.gather(*writers, return_exceptions=True)
+        await asyncio.gather(*(ws.close() for ws in websockets), return_exceptions=True)
+    
+    async def close_all(self):
+        """Close every open connection across all projects"""
+        await asyncio.gather(
+            *(
+                self._close_local(project_id)
+                for project_id in list(self.project_users)
+            ),
+            return_exceptions=True
+        )
     
     async def handle_edit(self, project_id: str, user_id: str, data: dict):
         """Handle file edit messages"""
-        message = {
-            "type": "file_edit",
-            "project_id": project_id,
-            "user_id": user_id,
-            "data": data,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+        key = (project_id, user_id)
+        ops = self.edit_buffers.get(key)
+        if ops is not None:
+            # A flush is already scheduled for this user; ride along with it
+            ops.append(data)
+            return
+        
+        self.edit_buffers[key] = [data]
+        self._spawn(self._flush_edits(project_id, user_id))
+    
+    async def _flush_edits(self, project_id: str, user_id: str):
+        """Broadcast a user's buffered edits once the current burst has been read"""
+        # Yield once so edits already waiting on the socket join this broadcast
+        await asyncio.sleep(0)
+        ops = self.edit_buffers.pop((project_id, user_id), None)
+        if not ops:
+            return
+        
+        if len(ops) == 1:
+            message = {
+                "type": "file_edit",
+                "project_id": project_id,
+                "user_id": user_id,
+                "data": ops[0],
+                "timestamp": now_ms()
+            }
+        else:
+            message = {
+                "type": "file_edit_batch",
+                "project_id": project_id,
+                "user_id": user_id,
+                "ops": ops,
+                "timestamp": now_ms()
+            }
         
         await self.broadcast_to_project(project_id, message, exclude_user=user_id)
     
     async def handle_cursor(self, project_id: str, user_id: str, data: dict):
         """Handle cursor position updates"""
-        message = {
-            "type": "cursor_update",
-            "project_id": project_id,
-            "user_id": user_id,
-            "data": data,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+        prefix = self.cursor_prefixes.get((project_id, user_id))
+        if prefix is None:
+            return
         
-        await self.broadcast_to_project(project_id, message, exclude_user=user_id)
+        # Fixed message shape: splice the data into the pre-rendered frame instead of building a dict
+        payload = f'{prefix}{orjson.dumps(data).decode()},"timestamp":{now_ms()}}}'
+        await self._broadcast_payload(project_id, payload, exclude_user=user_id)
+
+def project_to_dict(project: Project, file_count: int = 0) -> Dict[str, Any]:
+    """Build a project response payload from a database model"""
+    return {
+        "id": project.id,
+        "name": project.name,
+        "description": project.description,
+        "language": project.language,
+        "architecture_type": project.architecture_type,
+        "created_at": project.created_at,
+        "updated_at": project.updated_at,
+        "file_count": file_count or 0
+    }
+
+def project_to_response(project: Project, file_count: int = 0) -> ProjectResponse:
+    """Build a project response model from a database model"""
+    return ProjectResponse.model_validate(project_to_dict(project, file_count))
 
 # Database dependency
 async def get_db():
@@ -240,12 +666,53 @@ async def get_db():
             await session.close()
 
 # Redis dependency
-async def get_redis():
-    """Dependency to get Redis connection"""
+async def get_redis() -> redis.Redis:
+    """Dependency to get a Redis client backed by the shared connection pool"""
     global redis_pool
     if redis_pool is None:
-        redis_pool = await aioredis.from_url(REDIS_URL, decode_responses=True)
-    return redis_pool
+        redis_pool = redis.ConnectionPool.from_url(
+            REDIS_URL, decode_responses=True, max_connections=50
+        )
+    return redis.Redis(connection_pool=redis_pool)
+
+def _migrate_files_table(conn) -> None:
+    """
+    Bring a files table created by an older build up to the current schema.
+    
+    create_all never alters existing tables, so a database from before the
+    cascading project foreign key and the (project_id, path) unique index
+    lacks both. SQLite cannot add a constraint in place: the table is
+    rebuilt, dropping rows of deleted projects and keeping the oldest of
+    any duplicate paths, as the old select-then-insert could race into.
+    """
+    cascades = any(
+        row[2] == "projects" and row[6] == "CASCADE"
+        for row in conn.exec_driver_sql("PRAGMA foreign_key_list(files)")
+    )
+    if cascades:
+        return
+    
+    logger.info("Migrating files table: adding project ON DELETE CASCADE and unique paths")
+    old_columns = {row[1] for row in conn.exec_driver_sql("PRAGMA table_info(files)")}
+    columns = ", ".join(c.name for c in File.__table__.columns if c.name in old_columns)
+    
+    conn.exec_driver_sql("ALTER TABLE files RENAME TO _files_old")
+    old_indexes = conn.exec_driver_sql(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = '_files_old' AND sql IS NOT NULL"
+    ).scalars().all()
+    for name in old_indexes:
+        conn.exec_driver_sql(f'DROP INDEX "{name}"')
+    
+    File.__table__.create(conn)
+    copied = conn.exec_driver_sql(
+        f"INSERT OR IGNORE INTO files ({columns}) SELECT {columns} FROM _files_old "
+        "WHERE project_id IN (SELECT id FROM projects) ORDER BY created_at"
+    ).rowcount
+    total = conn.exec_driver_sql("SELECT count(*) FROM _files_old").scalar()
+    conn.exec_driver_sql("DROP TABLE _files_old")
+    
+    if copied != total:
+        logger.warning(f"Dropped {total - copied} orphaned or duplicate file rows while migrating")
 
 # Application lifespan
 @asynccontextmanager
@@ -257,9 +724,10 @@ async def lifespan(app: FastAPI):
     # Create database tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_migrate_files_table)
     
-    # Initialize Redis
-    await get_redis()
+    # Initialize Redis and relay project broadcasts between workers
+    await connection_manager.start_pubsub(await get_redis())
     
     logger.info("CodeCraft AI backend started successfully")
     
@@ -268,8 +736,11 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down CodeCraft AI backend...")
     
+    await connection_manager.stop_pubsub()
+    await connection_manager.close_all()
+    
     if redis_pool:
-        await redis_pool.close()
+        await redis_pool.disconnect()
     
     await engine.dispose()
     
@@ -280,16 +751,17 @@ app = FastAPI(
     title="CodeCraft AI - High-Concurrency Architectural Engine",
     description="Backend API for real-time collaborative code architecture",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify actual origins
+    allow_origins=list(ALLOWED_ORIGINS),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["content-type", "authorization"],
 )
 
 # Initialize connection manager
@@ -310,25 +782,21 @@ async def root():
         }
     }
 
-@app.get("/api/projects", response_model=List[ProjectResponse])
+@app.get(
+    "/api/projects",
+    response_model=None,
+    responses={200: {"model": List[ProjectResponse]}}
+)
 async def get_projects(db: AsyncSession = Depends(get_db)):
     """Get all projects"""
     try:
-        result = await db.execute("""
-            SELECT p.*, COUNT(f.id) as file_count
-            FROM projects p
-            LEFT JOIN files f ON p.id = f.project_id
-            GROUP BY p.id
-            ORDER BY p.updated_at DESC
-        """)
-        
-        projects = []
-        for row in result:
-            project_data = dict(row)
-            project_data["file_count"] = project_data.pop("COUNT(f.id)", 0)
-            projects.append(project_data)
-        
-        return projects
+        result = await db.execute(_Q_LIST_PROJECTS)
+        
+        # Hot read path: serialize plain dicts directly and skip response-model validation
+        return ORJSONResponse([
+            project_to_dict(row.Project, row.file_count)
+            for row in result.all()
+        ])
     except Exception as e:
         logger.error(f"Error getting projects: {e}")
         raise HTTPException(
@@ -340,30 +808,22 @@ async def get_projects(db: AsyncSession = Depends(get_db)):
 async def create_project(project: ProjectCreate, db: AsyncSession = Depends(get_db)):
     """Create a new project"""
     try:
+        # Generate keys and timestamps up front so the response needs no refresh SELECT
+        now = datetime.utcnow()
         db_project = Project(
+            id=str(uuid.uuid4()),
             name=project.name,
             description=project.description,
             language=project.language,
-            architecture_type=project.architecture_type
+            architecture_type=project.architecture_type,
+            created_at=now,
+            updated_at=now
         )
         
         db.add(db_project)
         await db.commit()
-        await db.refresh(db_project)
-        
-        # Convert to response model
-        response = ProjectResponse(
-            id=db_project.id,
-            name=db_project.name,
-            description=db_project.description,
-            language=db_project.language,
-            architecture_type=db_project.architecture_type,
-            created_at=db_project.created_at,
-            updated_at=db_project.updated_at,
-            file_count=0
-        )
         
-        return response
+        return project_to_response(db_project, 0)
     except Exception as e:
         await db.rollback()
         logger.error(f"Error creating project: {e}")
@@ -376,31 +836,17 @@ async def create_project(project: ProjectCreate, db: AsyncSession = Depends(get_
 async def get_project(project_id: str, db: AsyncSession = Depends(get_db)):
     """Get a specific project by ID"""
     try:
-        # Get project
-        result = await db.execute(
-            "SELECT * FROM projects WHERE id = :id",
-            {"id": project_id}
-        )
-        project = result.fetchone()
+        # Get project and file count in a single round-trip
+        result = await db.execute(_Q_GET_PROJECT, {"project_id": project_id})
+        row = result.first()
         
-        if not project:
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Project not found"
             )
         
-        # Get file count
-        result = await db.execute(
-            "SELECT COUNT(*) as file_count FROM files WHERE project_id = :project_id",
-            {"project_id": project_id}
-        )
-        file_count = result.scalar() or 0
-        
-        project_dict = dict(project)
-        return ProjectResponse(
-            **project_dict,
-            file_count=file_count
-        )
+        return project_to_response(row.Project, row.file_count)
     except HTTPException:
         raise
     except Exception as e:
@@ -414,43 +860,25 @@ async def get_project(project_id: str, db: AsyncSession = Depends(get_db)):
 async def delete_project(project_id: str, db: AsyncSession = Depends(get_db)):
     """Delete a project and all its files"""
     try:
-        # Check if project exists
-        result = await db.execute(
-            "SELECT id FROM projects WHERE id = :id",
-            {"id": project_id}
-        )
-        if not result.fetchone():
+        # Delete the project in one statement; its files go with it via ON DELETE CASCADE
+        result = await db.execute(_Q_DELETE_PROJECT, {"project_id": project_id})
+        if result.first() is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Project not found"
             )
         
-        # Delete files first (foreign key constraint)
-        await db.execute(
-            "DELETE FROM files WHERE project_id = :project_id",
-            {"project_id": project_id}
-        )
-        
-        # Delete project
-        await db.execute(
-            "DELETE FROM projects WHERE id = :id",
-            {"id": project_id}
-        )
-        
         await db.commit()
         
-        # Notify WebSocket connections
-        if project_id in connection_manager.active_connections:
-            message = {
+        # Notify WebSocket connections and close them
+        await connection_manager.close_project(
+            project_id,
+            {
                 "type": "project_deleted",
                 "project_id": project_id,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_ms()
             }
-            await connection_manager.broadcast_to_project(project_id, message)
-            
-            # Clean up connections
-            for user_id in list(connection_manager.active_connections[project_id].keys()):
-                connection_manager.disconnect(project_id, user_id)
+        )
         
         return None
     except HTTPException:
@@ -463,29 +891,27 @@ async def delete_project(project_id: str, db: AsyncSession = Depends(get_db)):
             detail="Failed to delete project"
         )
 
-@app.get("/api/projects/{project_id}/files", response_model=List[FileResponse])
+@app.get(
+    "/api/projects/{project_id}/files",
+    response_model=None,
+    responses={200: {"model": List[FileResponse]}}
+)
 async def get_project_files(project_id: str, db: AsyncSession = Depends(get_db)):
     """Get all files for a project"""
     try:
         # Verify project exists
-        result = await db.execute(
-            "SELECT id FROM projects WHERE id = :id",
-            {"id": project_id}
-        )
+        result = await db.execute(_Q_PROJECT_EXISTS, {"project_id": project_id})
         if not result.fetchone():
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Project not found"
             )
         
-        # Get files
-        result = await db.execute(
-            "SELECT * FROM files WHERE project_id = :project_id ORDER BY path",
-            {"project_id": project_id}
-        )
+        # Get files; selecting typed table columns keeps timestamps as datetimes for orjson
+        rows = (await db.execute(_Q_PROJECT_FILES, {"project_id": project_id})).mappings().all()
         
-        files = [dict(row) for row in result]
-        return files
+        # Hot read path: serialize plain dicts directly and skip response-model validation
+        return ORJSONResponse([dict(row) for row in rows])
     except HTTPException:
         raise
     except Exception as e:
@@ -503,35 +929,102 @@ async def create_file(
 ):
     """Create a new file in a project"""
     try:
-        # Verify project exists
-        result = await db.execute(
-            "SELECT id FROM projects WHERE id = :id",
-            {"id": project_id}
-        )
-        if not result.fetchone():
+        now = datetime.utcnow()
+        values = {
+            "id": str(uuid.uuid4()),
+            "path": file.path,
+            "content": file.content,
+            "purpose": file.purpose,
+            "project_id": project_id,
+            "version": 0,
+            "created_at": now,
+            "updated_at": now
+        }
+        
+        # Insert unless the path is taken; the project foreign key rejects unknown projects
+        try:
+            result = await db.execute(_Q_INSERT_FILE, values)
+        except IntegrityError:
+            await db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Project not found"
             )
         
-        # Check if file already exists
-        result = await db.execute(
-            "SELECT id FROM files WHERE project_id = :project_id AND path = :path",
-            {"project_id": project_id, "path": file.path}
-        )
-        if result.fetchone():
+        if result.first() is None:
+            await db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="File with this path already exists in the project"
             )
         
-        # Create file
-        db_file = File(
-            path=file.path,
-            content=file.content,
-            purpose=file.purpose,
-            project_id=project_id,
-            version=0
+        await db.commit()
+        
+        # Notify WebSocket connections
+        await connection_manager.broadcast_to_project(
+            project_id,
+            {
+                "type": "file_created",
+                "project_id": project_id,
+                "file_id": values["id"],
+                "path": values["path"],
+                "timestamp": now_ms()
+            }
         )
         
-        db
\ No newline at end of file
+        return FileResponse.model_validate(values)
+    except HTTPException:
+        raise
+    except Exception as e:
+        await db.rollback()
+        logger.error(f"Error creating file in project {project_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to create file"
+        )
+
+# WebSocket endpoint
+@app.websocket("/ws/{project_id}/{user_id}")
+async def websocket_endpoint(websocket: WebSocket, project_id: str, user_id: str):
+    """WebSocket endpoint for real-time collaboration in a project room"""
+    await connection_manager.connect(websocket, project_id, user_id)
+    
+    try:
+        while True:
+            message = orjson.loads(await websocket.receive_text())
+            message_type = message.get("type")
+            data = message.get("data", {})
+            
+            if message_type == "edit":
+                await connection_manager.handle_edit(project_id, user_id, data)
+            elif message_type == "cursor":
+                await connection_manager.handle_cursor(project_id, user_id, data)
+            else:
+                logger.warning(f"Unknown WebSocket message type from user {user_id}: {message_type}")
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.error(f"WebSocket error for user {user_id} in project {project_id}: {e}")
+    finally:
+        connection_manager.disconnect(project_id, user_id)
+        await connection_manager.broadcast_to_project(
+            project_id,
+            {
+                "type": "user_left",
+                "user_id": user_id,
+                "project_id": project_id,
+                "timestamp": now_ms()
+            }
+        )
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=True,
+        loop="uvloop" if UVLOOP_AVAILABLE else "asyncio",
+        http="httptools",
+        ws="websockets"
+    )
@@ -12,16 +12,39 @@ This module provides a robust, version-aware email configuration system with:
 import os
 import sys
 import logging
-from typing import Dict, Any, Optional, List, Union, Literal
+from typing import Callable, Dict, Any, Optional, List, Tuple, Union, Literal
 from enum import Enum
-from pydantic import BaseModel, Field, validator, root_validator
-from pydantic_settings import BaseSettings
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator, validator, root_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
 
+try:
+    from packaging import version as _pkg_version
+except ImportError:
+    _pkg_version = None
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=16)
+def _parsed_version(s: str):
+    """Parse a version string once; None when 'packaging' is unavailable"""
+    return _pkg_version.parse(s) if _pkg_version else None
+
+
+# FastAPI-Mail version thresholds, parsed once at import
+_V033 = _parsed_version("0.3.3")
+_V030 = _parsed_version("0.3.0")
+_V020 = _parsed_version("0.2.0")
+
+
+@lru_cache(maxsize=32)
+def _folder_exists(path: str) -> bool:
+    """Cached existence check for template folders; cleared when configuration changes"""
+    return os.path.exists(path)
+
+
 class EmailBackend(str, Enum):
     """Supported email backends"""
     SMTP = "smtp"
@@ -38,8 +61,26 @@ class EmailSecurity(str, Enum):
     STARTTLS = "starttls"
 
 
+# Legacy (use_tls, use_ssl) flags implied by each security mode
+_SECURITY_TO_LEGACY = {
+    EmailSecurity.NONE: (False, False),
+    EmailSecurity.SSL: (False, True),
+    EmailSecurity.TLS: (True, False),
+    EmailSecurity.STARTTLS: (True, False),
+}
+
+# Security modes that encrypt the connection, and those negotiated over TLS
+_SECURE_SECURITIES = frozenset({EmailSecurity.SSL, EmailSecurity.TLS, EmailSecurity.STARTTLS})
+_TLS_SECURITIES = frozenset({EmailSecurity.TLS, EmailSecurity.STARTTLS})
+
+# FastAPI-Mail keys kept even when False, since their absence changes the library default
+_MAIL_TLS_KEEP = frozenset({"MAIL_TLS", "MAIL_SSL"})
+
+
 class EmailTemplateConfig(BaseModel):
     """Configuration for email templates"""
+    model_config = ConfigDict(defer_build=True, frozen=True)
+    
     folder: str = Field(default="templates/email", description="Template folder path")
     jinja_extensions: List[str] = Field(
         default=["jinja2.ext.i18n", "jinja2.ext.do"],
@@ -51,6 +92,8 @@ class EmailTemplateConfig(BaseModel):
 
 class EmailConnectionPoolConfig(BaseModel):
     """Connection pooling configuration"""
+    model_config = ConfigDict(defer_build=True, frozen=True)
+    
     enabled: bool = Field(default=True, description="Enable connection pooling")
     max_connections: int = Field(default=10, ge=1, le=100, description="Max pool size")
     idle_timeout: int = Field(default=300, ge=60, description="Idle timeout in seconds")
@@ -59,6 +102,8 @@ class EmailConnectionPoolConfig(BaseModel):
 
 class EmailRetryConfig(BaseModel):
     """Retry configuration for failed email sends"""
+    model_config = ConfigDict(defer_build=True, frozen=True)
+    
     enabled: bool = Field(default=True, description="Enable retry mechanism")
     max_attempts: int = Field(default=3, ge=1, le=10, description="Max retry attempts")
     initial_delay: float = Field(default=1.0, ge=0.1, description="Initial delay in seconds")
@@ -106,11 +151,20 @@ class EmailConfig(BaseSettings):
     # FastAPI-Mail version compatibility
     fastapi_mail_version: str = Field(default="0.3.3", description="FastAPI-Mail version")
     
-    class Config:
-        env_prefix = "EMAIL_"
-        env_nested_delimiter = "__"
-        case_sensitive = False
-        extra = "ignore"
+    # Built on first get_fastapi_mail_config() call; reset by EmailConfigManager.update_config
+    _cached_fm_config: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    _sender_tuple: tuple = PrivateAttr(default=())
+    _conn_config_cache: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    
+    model_config = SettingsConfigDict(
+        env_prefix="EMAIL_",
+        env_nested_delimiter="__",
+        case_sensitive=False,
+        extra="ignore",
+        # Build the validation schema on first use rather than at import
+        defer_build=True,
+        frozen=True,
+    )
     
     @validator("smtp_password", pre=True)
     def validate_password(cls, v):
@@ -120,7 +174,7 @@ class EmailConfig(BaseSettings):
             return v
         return v
     
-    @root_validator
+    @root_validator(skip_on_failure=True)
     def validate_security_settings(cls, values):
         """Validate and normalize security settings"""
         security = values.get("smtp_security")
@@ -128,18 +182,9 @@ class EmailConfig(BaseSettings):
         use_ssl = values.get("use_ssl")
         
         # Backward compatibility: map legacy flags to new security enum
-        if security == EmailSecurity.NONE:
-            values["use_tls"] = False
-            values["use_ssl"] = False
-        elif security == EmailSecurity.SSL:
-            values["use_tls"] = False
-            values["use_ssl"] = True
-        elif security == EmailSecurity.TLS:
-            values["use_tls"] = True
-            values["use_ssl"] = False
-        elif security == EmailSecurity.STARTTLS:
-            values["use_tls"] = True
-            values["use_ssl"] = False
+        legacy_flags = _SECURITY_TO_LEGACY.get(security)
+        if legacy_flags is not None:
+            values["use_tls"], values["use_ssl"] = legacy_flags
         
         # If security is not set but legacy flags are, infer security
         elif not security and (use_tls or use_ssl):
@@ -150,31 +195,43 @@ class EmailConfig(BaseSettings):
         
         return values
     
+    @model_validator(mode="after")
+    def build_sender_tuple(self):
+        """Store the (name, email) sender tuple once; the model is frozen so it cannot go stale"""
+        self._sender_tuple = (self.default_sender_name, self.default_sender_email)
+        return self
+    
     @property
     def sender_tuple(self) -> tuple:
         """Get sender as (name, email) tuple for FastAPI-Mail"""
-        return (self.default_sender_name, self.default_sender_email)
+        return self._sender_tuple
     
     @property
     def is_secure_connection(self) -> bool:
         """Check if connection uses SSL/TLS"""
-        return self.smtp_security in [EmailSecurity.SSL, EmailSecurity.TLS, EmailSecurity.STARTTLS]
+        return self.smtp_security in _SECURE_SECURITIES
     
     @property
     def supports_connection_pooling(self) -> bool:
         """Check if current FastAPI-Mail version supports connection pooling"""
-        try:
-            from packaging import version
-            return version.parse(self.fastapi_mail_version) >= version.parse("0.3.3")
-        except ImportError:
+        if _pkg_version is None:
             # If packaging not available, assume no pooling for safety
             return False
+        return _parsed_version(self.fastapi_mail_version) >= _V033
     
     def get_fastapi_mail_config(self) -> Dict[str, Any]:
         """
         Generate configuration dictionary compatible with FastAPI-Mail.
         Handles version differences between 0.2.x and 0.3.x.
+        The result is built once and shared; treat it as read-only.
         """
+        if self._cached_fm_config is not None:
+            return self._cached_fm_config
+        
+        # Enum members are singletons, so identity checks suffice
+        security = self.smtp_security
+        is_ssl = security is EmailSecurity.SSL
+        
         config = {
             "MAIL_USERNAME": self.smtp_user,
             "MAIL_PASSWORD": self.smtp_password,
@@ -182,59 +239,72 @@ class EmailConfig(BaseSettings):
             "MAIL_PORT": self.smtp_port,
             "MAIL_SERVER": self.smtp_host,
             "MAIL_FROM_NAME": self.default_sender_name,
-            "MAIL_STARTTLS": self.smtp_security == EmailSecurity.STARTTLS,
-            "MAIL_SSL_TLS": self.smtp_security == EmailSecurity.SSL,
+            "MAIL_STARTTLS": security is EmailSecurity.STARTTLS,
+            "MAIL_SSL_TLS": is_ssl,
             "MAIL_USE_CREDENTIALS": bool(self.smtp_user and self.smtp_password),
             "MAIL_VALIDATE_CERTS": self.validate_certs,
             "USE_CREDENTIALS": bool(self.smtp_user and self.smtp_password),
         }
         
         # Version-specific adjustments
-        try:
-            from packaging import version
-            current_version = version.parse(self.fastapi_mail_version)
+        if _pkg_version is not None:
+            current_version = _parsed_version(self.fastapi_mail_version)
             
-            if current_version >= version.parse("0.3.0"):
+            if current_version >= _V030:
                 # 0.3.x uses different field names
                 config.update({
-                    "MAIL_TLS": self.smtp_security == EmailSecurity.TLS,
-                    "MAIL_SSL": self.smtp_security == EmailSecurity.SSL,
+                    "MAIL_TLS": security is EmailSecurity.TLS,
+                    "MAIL_SSL": is_ssl,
                 })
                 
                 # Remove old field names to avoid conflicts
                 config.pop("MAIL_STARTTLS", None)
                 config.pop("MAIL_SSL_TLS", None)
                 
-            elif current_version >= version.parse("0.2.0"):
+            elif current_version >= _V020:
                 # 0.2.x compatibility
                 config.update({
                     "MAIL_TLS": self.use_tls,
                     "MAIL_SSL": self.use_ssl,
                 })
         
-        except ImportError:
+        else:
             # Fallback to conservative defaults
             logger.warning("packaging module not found, using conservative email config")
         
         # Add template configuration if templates are enabled
-        if os.path.exists(self.templates.folder):
+        if _folder_exists(self.templates.folder):
             config["MAIL_TEMPLATE_FOLDER"] = self.templates.folder
         
-        # Filter out empty values
-        return {k: v for k, v in config.items() if v not in (None, "", False) or k in ["MAIL_TLS", "MAIL_SSL"]}
+        # Filter out empty values in place
+        for key in list(config):
+            value = config[key]
+            if (value is None or value is False or value == "") and key not in _MAIL_TLS_KEEP:
+                del config[key]
+        
+        self._cached_fm_config = config
+        return config
     
     def get_connection_config(self) -> Dict[str, Any]:
-        """Get connection-specific configuration"""
-        return {
+        """
+        Get connection-specific configuration.
+        The result is built once and shared; treat it as read-only.
+        """
+        if self._conn_config_cache is not None:
+            return self._conn_config_cache
+        
+        security = self.smtp_security
+        self._conn_config_cache = {
             "host": self.smtp_host,
             "port": self.smtp_port,
             "username": self.smtp_user,
             "password": self.smtp_password,
-            "use_tls": self.smtp_security in [EmailSecurity.TLS, EmailSecurity.STARTTLS],
-            "use_ssl": self.smtp_security == EmailSecurity.SSL,
+            "use_tls": security in _TLS_SECURITIES,
+            "use_ssl": security is EmailSecurity.SSL,
             "timeout": self.timeout,
             "validate_certs": self.validate_certs,
         }
+        return self._conn_config_cache
     
     def validate_configuration(self) -> List[str]:
         """
@@ -255,36 +325,93 @@ class EmailConfig(BaseSettings):
                 warnings.append(f"STARTTLS typically uses port 587, but configured port is {self.smtp_port}")
         
         # Check template folder
-        if not os.path.exists(self.templates.folder):
+        if not _folder_exists(self.templates.folder):
             warnings.append(f"Template folder '{self.templates.folder}' does not exist")
         
         # Check FastAPI-Mail version compatibility
-        try:
-            from packaging import version
-            current_version = version.parse(self.fastapi_mail_version)
+        if _pkg_version is not None:
+            current_version = _parsed_version(self.fastapi_mail_version)
             
-            if current_version < version.parse("0.2.0"):
+            if current_version < _V020:
                 warnings.append(f"FastAPI-Mail version {self.fastapi_mail_version} is very old, consider upgrading")
             
-            if current_version >= version.parse("0.3.0") and self.connection_pool.enabled:
+            if current_version >= _V030 and self.connection_pool.enabled:
                 if not self.supports_connection_pooling:
                     warnings.append("Connection pooling requires FastAPI-Mail 0.3.3+")
         
-        except ImportError:
+        else:
             warnings.append("Cannot validate FastAPI-Mail version without 'packaging' module")
         
         return warnings
 
 
+# EmailConfigManager cache key for a load with no env file and no overrides
+_DEFAULT_CACHE_KEY = (None, frozenset())
+
+
+def _overrides_cache_key(env_file: Optional[str], overrides: Dict[str, Any]) -> Tuple[Optional[str], Any]:
+    """Cache key for a config load; unhashable override values (lists, dicts) are keyed on their repr."""
+    if env_file is None and not overrides:
+        # Default configuration: fixed key, nothing to hash
+        return _DEFAULT_CACHE_KEY
+    try:
+        return (env_file, frozenset(overrides.items()))
+    except TypeError:
+        return (env_file, repr(sorted(overrides.items())))
+
+
+def _apply_legacy_security(values: Dict[str, Any], current_flags: Callable[[], Tuple[bool, bool]]) -> None:
+    """
+    Translate use_tls/use_ssl in values into the smtp_security they imply.
+    
+    Validation re-derives the legacy flags from smtp_security, so flags passed
+    on their own would otherwise be overwritten. A flag that is not given comes
+    from an explicit smtp_security, else from current_flags().
+    
+    Raises:
+        ValueError: If the flags contradict an explicit smtp_security
+    """
+    if "use_tls" not in values and "use_ssl" not in values:
+        return
+    
+    security = values.get("smtp_security")
+    if security is not None:
+        security = EmailSecurity(security)
+        base_tls, base_ssl = _SECURITY_TO_LEGACY[security]
+    elif "use_tls" in values and "use_ssl" in values:
+        base_tls = base_ssl = False
+    else:
+        base_tls, base_ssl = current_flags()
+    use_tls = bool(values.get("use_tls", base_tls))
+    use_ssl = bool(values.get("use_ssl", base_ssl))
+    
+    if security is None:
+        if use_ssl:
+            values["smtp_security"] = EmailSecurity.SSL
+        elif use_tls:
+            values["smtp_security"] = EmailSecurity.TLS
+        else:
+            values["smtp_security"] = EmailSecurity.NONE
+    elif _SECURITY_TO_LEGACY[security] != (use_tls, use_ssl):
+        raise ValueError(
+            f"Conflicting email security settings: smtp_security={security.value} "
+            f"with use_tls={use_tls}, use_ssl={use_ssl}"
+        )
+
+
 class EmailConfigManager:
     """
     Manager class for email configuration with caching and runtime adjustments.
     """
     
+    __slots__ = ("_config", "_config_cache", "_override_settings", "_valid_overrides")
+    
     def __init__(self):
         self._config: Optional[EmailConfig] = None
-        self._config_cache: Dict[str, EmailConfig] = {}
+        self._config_cache: Dict[Tuple[Optional[str], Any], EmailConfig] = {}
         self._override_settings: Dict[str, Any] = {}
+        # Subset of _override_settings naming real EmailConfig fields, ready to pass to the constructor
+        self._valid_overrides: Dict[str, Any] = {}
     
     def load_config(self, env_file: Optional[str] = None, **overrides) -> EmailConfig:
         """
@@ -297,7 +424,7 @@ class EmailConfigManager:
         Returns:
             EmailConfig instance
         """
-        cache_key = f"{env_file}:{str(sorted(overrides.items()))}"
+        cache_key = _overrides_cache_key(env_file, overrides)
         
         if cache_key in self._config_cache:
             return self._config_cache[cache_key]
@@ -307,32 +434,39 @@ class EmailConfigManager:
         if env_file:
             config_kwargs["_env_file"] = env_file
         
-        config = EmailConfig(**config_kwargs)
-        
-        # Apply overrides
+        # Overrides, then runtime overrides, go straight to the constructor so the model validates once
+        fields = EmailConfig.model_fields
         for key, value in overrides.items():
-            if hasattr(config, key):
-                setattr(config, key, value)
+            if key in fields:
+                config_kwargs[key] = value
+        
+        config_kwargs.update(self._valid_overrides)
+        
+        def base_flags() -> Tuple[bool, bool]:
+            # Legacy flags the settings yield without the overridden ones
+            base = EmailConfig(**{k: v for k, v in config_kwargs.items() if k not in ("use_tls", "use_ssl")})
+            return base.use_tls, base.use_ssl
         
-        # Apply runtime overrides
-        for key, value in self._override_settings.items():
-            if hasattr(config, key):
-                setattr(config, key, value)
+        _apply_legacy_security(config_kwargs, base_flags)
+        config = EmailConfig(**config_kwargs)
         
-        # Validate configuration
-        warnings = config.validate_configuration()
-        if warnings:
-            logger.warning("Email configuration warnings:")
-            for warning in warnings:
-                logger.warning(f"  - {warning}")
+        # Validate configuration; the checks only feed warnings, so skip them if nobody will see those
+        if logger.isEnabledFor(logging.WARNING):
+            warnings = config.validate_configuration()
+            if warnings:
+                logger.warning("Email configuration warnings:")
+                for warning in warnings:
+                    logger.warning(f"  - {warning}")
         
         self._config_cache[cache_key] = config
         self._config = config
         
-        logger.info(f"Email configuration loaded for backend: {config.backend.value}")
-        if config.backend == EmailBackend.SMTP:
-            logger.info(f"SMTP Server: {config.smtp_host}:{config.smtp_port}")
-            logger.info(f"Security: {config.smtp_security.value}")
+        # Lazy %-formatting: nothing is rendered when INFO is disabled
+        backend = config.backend
+        logger.info("Email configuration loaded for backend: %s", backend.value)
+        if backend is EmailBackend.SMTP:
+            logger.info("SMTP Server: %s:%s", config.smtp_host, config.smtp_port)
+            logger.info("Security: %s", config.smtp_security.value)
         
         return config
     
@@ -352,15 +486,28 @@ class EmailConfigManager:
         if self._config is None:
             self._config = self.load_config()
         
+        updates = {}
         for key, value in settings.items():
             if hasattr(self._config, key):
-                setattr(self._config, key, value)
-                logger.info(f"Updated email configuration: {key} = {value}")
+                updates[key] = value
             else:
                 logger.warning(f"Ignoring unknown email configuration key: {key}")
         
+        # Revalidation re-derives the legacy flags from smtp_security, so translate them the other way first
+        config = self._config
+        _apply_legacy_security(updates, lambda: (config.use_tls, config.use_ssl))
+        
+        # EmailConfig is frozen: swap in an updated copy rather than mutating in place
+        self._config = EmailConfig.model_validate({**self._config.model_dump(), **updates})
+        for key in settings:
+            if key in updates:
+                logger.info(f"Updated email configuration: {key} = {settings[key]}")
+        
         # Clear cache since configuration changed
+        self._config._cached_fm_config = None
         self._config_cache.clear()
+        _email_config_cache.clear()
+        _folder_exists.cache_clear()
     
     def set_override(self, key: str, value: Any):
         """
@@ -371,12 +518,17 @@ class EmailConfigManager:
             value: Value to override with
         """
         self._override_settings[key] = value
+        if key in EmailConfig.model_fields:
+            self._valid_overrides[key] = value
         logger.info(f"Set persistent email config override: {key} = {value}")
     
     def clear_overrides(self):
         """Clear all persistent overrides"""
         self._override_settings.clear()
+        self._valid_overrides.clear()
         self._config_cache.clear()
+        _email_config_cache.clear()
+        _folder_exists.cache_clear()
         logger.info("Cleared all email configuration overrides")
     
     def get_fastapi_mail_config_dict(self) -> Dict[str, Any]:
@@ -393,19 +545,20 @@ class EmailConfigManager:
         """
         config = self.get_config()
         
-        if config.backend != EmailBackend.SMTP:
-            logger.info(f"Backend {config.backend.value} doesn't require connection test")
+        backend = config.backend
+        if backend is not EmailBackend.SMTP:
+            logger.info("Backend %s doesn't require connection test", backend.value)
             return True
         
         if config.suppress_send:
             logger.info("Email sending suppressed, skipping connection test")
             return True
         
+        # Imported here so processes that never test SMTP don't pay for smtplib/ssl/email.*
+        import smtplib
+        
         try:
-            import smtplib
-            import socket
-            
-            logger.info(f"Testing SMTP connection to {config.smtp_host}:{config.smtp_port}")
+            logger.info("Testing SMTP connection to %s:%s", config.smtp_host, config.smtp_port)
             
             # Create SMTP connection based on security settings
             if config.smtp_security == EmailSecurity.SSL:
@@ -437,7 +590,7 @@ class EmailConfigManager:
             logger.info("SMTP connection test passed")
             return True
             
-        except (smtplib.SMTPException, socket.error, socket.timeout) as e:
+        except (smtplib.SMTPException, OSError) as e:
             logger.error(f"SMTP connection test failed: {str(e)}")
             return False
         except Exception as e:
@@ -448,6 +601,9 @@ class EmailConfigManager:
 # Global configuration manager instance
 _config_manager: Optional[EmailConfigManager] = None
 
+# get_email_config() results, keyed like EmailConfigManager._config_cache
+_email_config_cache: Dict[Tuple[Optional[str], Any], EmailConfig] = {}
+
 
 def get_email_config_manager() -> EmailConfigManager:
     """
@@ -462,7 +618,6 @@ def get_email_config_manager() -> EmailConfigManager:
     return _config_manager
 
 
-@lru_cache(maxsize=1)
 def get_email_config(env_file: Optional[str] = None, **overrides) -> EmailConfig:
     """
     Get email configuration with caching.
@@ -474,4 +629,9 @@ def get_email_config(env_file: Optional[str] = None, **overrides) -> EmailConfig
     Returns:
         EmailConfig instance
     """
-    manager = get
\ No newline at end of file
+    key = _overrides_cache_key(env_file, overrides)
+    config = _email_config_cache.get(key)
+    if config is None:
+        config = get_email_config_manager().load_config(env_file, **overrides)
+        _email_config_cache[key] = config
+    return config
@@ -14,23 +14,60 @@ import asyncio
 import logging
 import os
 import sys
-from typing import Any, Dict, List, Optional, Union, cast
+import time
+import weakref
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import (
+    Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Union, cast
+)
 
-import redis.asyncio as redis
 from redis.asyncio import Redis, Sentinel, ConnectionPool
 from redis.asyncio.sentinel import SentinelConnectionPool
 from redis.asyncio.cluster import RedisCluster
+from redis.asyncio.connection import SSLConnection
+from redis.asyncio.retry import Retry
+from redis.backoff import EqualJitterBackoff, ExponentialBackoff
 from redis.exceptions import (
     AuthenticationError,
     ConnectionError,
     RedisError,
     TimeoutError,
 )
-from pydantic import BaseSettings, Field, validator
+from pydantic import AliasChoices, Field, PrivateAttr, model_validator, root_validator, validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+try:
+    import hiredis  # noqa: F401
+    from redis._parsers import _AsyncHiredisParser
+    HIREDIS_AVAILABLE = True
+except ImportError:
+    HIREDIS_AVAILABLE = False
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# Opt-in (REDIS_USE_UVLOOP=1): uvloop's libuv scheduler roughly halves per-await overhead on command round-trips
+if UVLOOP_AVAILABLE and sys.platform != "win32" and os.getenv("REDIS_USE_UVLOOP") == "1":
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+if not HIREDIS_AVAILABLE:
+    logger.warning(
+        "hiredis is not installed; Redis replies will be parsed in pure Python. "
+        "Run 'pip install hiredis' for the C parser."
+    )
+
+# Sentinel/cluster health checks stretch their interval up to this multiple of
+# health_check_interval after HEALTH_CHECK_IDLE_CYCLES consecutive healthy checks
+HEALTH_CHECK_MAX_BACKOFF = 5
+HEALTH_CHECK_IDLE_CYCLES = 3
+
 
 class RedisSettings(BaseSettings):
     """
@@ -44,44 +81,59 @@ class RedisSettings(BaseSettings):
         REDIS_MODE: Redis deployment mode - 'single', 'sentinel', or 'cluster'
         REDIS_SENTINEL_MASTER: Sentinel master name
         REDIS_SENTINEL_NODES: Comma-separated list of sentinel nodes (host:port)
-        REDIS_MAX_CONNECTIONS: Maximum connections in pool (default: 100)
+        REDIS_MAX_CONNECTIONS: Maximum connections in pool per worker (default: 32)
+        REDIS_MAXCLIENTS: Server-side maxclients limit shared by all workers (default: 10000)
+        REDIS_MIN_IDLE_CONNECTIONS: Connections opened up front at startup (default: 4)
+        WEB_CONCURRENCY: Number of worker processes sharing the server (default: 1)
         REDIS_TIMEOUT: Connection timeout in seconds (default: 5)
         REDIS_HEALTH_CHECK_INTERVAL: Health check interval in seconds (default: 30)
+        REDIS_MAX_PIPELINE_SIZE: Maximum commands sent per pipeline round-trip (default: 1000)
         REDIS_RETRY_ATTEMPTS: Number of connection retry attempts (default: 3)
-        REDIS_RETRY_DELAY: Delay between retries in seconds (default: 1)
+        REDIS_RETRY_DELAY: Base connect retry delay in seconds, doubled per attempt with jitter (default: 1)
         REDIS_SSL: Use SSL/TLS connection (default: false)
         REDIS_SSL_CERT_REQS: SSL certificate requirements
-        REDIS_DECODE_RESPONSES: Decode responses to strings (default: true)
+        REDIS_DECODE_RESPONSES: Decode responses to strings (default: false; callers get bytes
+            and decode only what they need)
     """
     
     # Basic connection settings
-    host: str = Field(default="localhost", env="REDIS_HOST")
-    port: int = Field(default=6379, env="REDIS_PORT")
-    password: Optional[str] = Field(default=None, env="REDIS_PASSWORD")
-    db: int = Field(default=0, env="REDIS_DB")
+    host: str = Field(default="localhost")
+    port: int = Field(default=6379)
+    password: Optional[str] = Field(default=None)
+    db: int = Field(default=0)
     
     # Deployment mode
-    mode: str = Field(default="single", env="REDIS_MODE")
+    mode: str = Field(default="single")
     
     # Sentinel configuration
-    sentinel_master: Optional[str] = Field(default=None, env="REDIS_SENTINEL_MASTER")
-    sentinel_nodes: Optional[str] = Field(default=None, env="REDIS_SENTINEL_NODES")
+    sentinel_master: Optional[str] = Field(default=None)
+    sentinel_nodes: Optional[str] = Field(default=None)
     
     # Connection pool settings
-    max_connections: int = Field(default=100, env="REDIS_MAX_CONNECTIONS")
-    timeout: int = Field(default=5, env="REDIS_TIMEOUT")
-    health_check_interval: int = Field(default=30, env="REDIS_HEALTH_CHECK_INTERVAL")
+    max_connections: int = Field(default=32, ge=1)
+    redis_maxclients: int = Field(default=10000, ge=1, validation_alias="REDIS_MAXCLIENTS")
+    workers: int = Field(
+        default=1, ge=1, validation_alias=AliasChoices("REDIS_WORKERS", "WEB_CONCURRENCY")
+    )
+    min_idle_connections: int = Field(default=4, ge=0)
+    # Derived: (host, port) pairs parsed from sentinel_nodes in sentinel mode
+    _parsed_sentinel_nodes: Optional[Tuple[Tuple[str, int], ...]] = PrivateAttr(default=None)
+    # Derived: max_connections capped to this worker's share (70%) of the server's maxclients
+    effective_max_connections: int = Field(default=0)
+    timeout: int = Field(default=5)
+    health_check_interval: int = Field(default=30)
+    max_pipeline_size: int = Field(default=1000, ge=1)
     
     # Retry settings
-    retry_attempts: int = Field(default=3, env="REDIS_RETRY_ATTEMPTS")
-    retry_delay: float = Field(default=1.0, env="REDIS_RETRY_DELAY")
+    retry_attempts: int = Field(default=3, gt=0)
+    retry_delay: float = Field(default=1.0, gt=0, lt=10)
     
     # SSL/TLS settings
-    ssl: bool = Field(default=False, env="REDIS_SSL")
-    ssl_cert_reqs: Optional[str] = Field(default=None, env="REDIS_SSL_CERT_REQS")
+    ssl: bool = Field(default=False)
+    ssl_cert_reqs: Optional[str] = Field(default=None)
     
-    # Response handling
-    decode_responses: bool = Field(default=True, env="REDIS_DECODE_RESPONSES")
+    # Response handling; raw bytes by default to skip a str allocation per reply
+    decode_responses: bool = Field(default=False)
     
     @validator('mode')
     def validate_mode(cls, v: str) -> str:
@@ -91,25 +143,30 @@ class RedisSettings(BaseSettings):
             raise ValueError(f"Redis mode must be one of: {valid_modes}")
         return v
     
-    @validator('sentinel_nodes')
-    def parse_sentinel_nodes(cls, v: Optional[str], values: Dict[str, Any]) -> Optional[List[tuple]]:
-        """Parse sentinel nodes from comma-separated string."""
-        if v is None or values.get('mode') != 'sentinel':
-            return None
+    @model_validator(mode="after")
+    def parse_sentinel_nodes(self) -> 'RedisSettings':
+        """Parse sentinel nodes from comma-separated string, once, into (host, port) pairs."""
+        if self.sentinel_nodes is None or self.mode != 'sentinel':
+            return self
         
         nodes = []
-        for node in v.split(','):
-            node = node.strip()
-            if ':' in node:
-                host, port = node.split(':', 1)
-                nodes.append((host.strip(), int(port.strip())))
-            else:
-                nodes.append((node.strip(), 26379))  # Default sentinel port
+        for node in self.sentinel_nodes.split(','):
+            host, sep, port = node.strip().partition(':')
+            if host:
+                nodes.append((host.strip(), int(port) if sep else 26379))  # Default sentinel port
         
         if not nodes:
             raise ValueError("At least one sentinel node must be specified for sentinel mode")
         
-        return nodes
+        self._parsed_sentinel_nodes = tuple(nodes)
+        return self
+    
+    @root_validator(skip_on_failure=True)
+    def compute_effective_max_connections(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        """Cap the pool so every worker's pool together stays under the server's maxclients."""
+        worker_share = int(values['redis_maxclients'] // values['workers'] * 0.7)
+        values['effective_max_connections'] = max(1, min(values['max_connections'], worker_share))
+        return values
     
     @validator('ssl_cert_reqs')
     def validate_ssl_cert_reqs(cls, v: Optional[str]) -> Optional[str]:
@@ -123,40 +180,62 @@ class RedisSettings(BaseSettings):
         
         return v.lower()
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
+    model_config = SettingsConfigDict(
+        env_prefix="REDIS_",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+        populate_by_name=True,
+        # Shared by every manager and coroutine, so never mutated after load
+        frozen=True,
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_settings() -> RedisSettings:
+    """Load Redis settings from the environment once per process."""
+    return RedisSettings()
 
 
 class RedisConnectionManager:
     """
     Manages Redis connections with health checks, reconnection logic, and pooling.
     
-    This class provides a singleton-like interface for accessing Redis clients
-    with automatic reconnection and health monitoring.
+    The shared instance comes from get_redis_manager(), one per event loop;
+    this class itself holds no class-level state.
     """
     
-    _instance: Optional['RedisConnectionManager'] = None
-    _client: Optional[Union[Redis, RedisCluster]] = None
-    _settings: Optional[RedisSettings] = None
-    _connection_pool: Optional[Union[ConnectionPool, SentinelConnectionPool]] = None
-    _health_check_task: Optional[asyncio.Task] = None
-    _is_connected: bool = False
-    _connection_lock: asyncio.Lock = asyncio.Lock()
-    
-    def __new__(cls) -> 'RedisConnectionManager':
-        """Singleton pattern to ensure single instance."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-    
     def __init__(self) -> None:
         """Initialize the connection manager."""
-        if not hasattr(self, '_initialized'):
-            self._initialized = True
-            self._settings = RedisSettings()
-            self._connection_lock = asyncio.Lock()
+        self._settings: Optional[RedisSettings] = _get_settings()
+        # Sockets, futures and the lock all belong to the loop the manager was created on
+        try:
+            self._loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
+        self._client: Optional[Union[Redis, RedisCluster]] = None
+        self._connection_pool: Optional[Union[ConnectionPool, SentinelConnectionPool]] = None
+        # The health check is a re-armed timer; a task exists only while a check runs
+        self._health_handle: Optional[asyncio.TimerHandle] = None
+        self._health_check_task: Optional[asyncio.Task] = None
+        self._health_interval: float = 0.0
+        self._healthy_checks: int = 0
+        # time.monotonic() of the last PING or connect that proved the server alive
+        self._last_health_check_ts: float = 0.0
+        self._is_connected: bool = False
+        # Bound methods of the live client, so hot calls skip get_client(); None while disconnected
+        self._execute_command: Optional[Callable[..., Awaitable[Any]]] = None
+        self._ping: Optional[Callable[[], Awaitable[Any]]] = None
+        # Created on first use so it binds to the running event loop, not the importing one
+        self._connection_lock: Optional[asyncio.Lock] = None
+    
+    def _lock(self) -> asyncio.Lock:
+        """Get the connection lock, creating it inside the running loop on first use."""
+        lock = self._connection_lock
+        if lock is None:
+            lock = self._connection_lock = asyncio.Lock()
+        return lock
     
     async def get_client(self) -> Union[Redis, RedisCluster]:
         """
@@ -168,7 +247,12 @@ class RedisConnectionManager:
         Raises:
             RedisError: If connection cannot be established
         """
-        async with self._connection_lock:
+        # Fast path: an established client needs no lock
+        client = self._client
+        if client is not None and self._is_connected:
+            return client
+        
+        async with self._lock():
             if self._client is None or not self._is_connected:
                 await self._connect()
             
@@ -184,63 +268,99 @@ class RedisConnectionManager:
         if self._settings is None:
             raise RedisError("Redis settings not initialized")
         
-        logger.info(f"Connecting to Redis in {self._settings.mode} mode...")
+        logger.info(
+            f"Connecting to Redis in {self._settings.mode} mode "
+            f"(pool cap {self._settings.effective_max_connections} for {self._settings.workers} worker(s))..."
+        )
+        
+        settings = self._settings
+        attempts = 0
         
-        for attempt in range(self._settings.retry_attempts):
-            try:
-                if self._settings.mode == 'single':
-                    await self._connect_single()
-                elif self._settings.mode == 'sentinel':
-                    await self._connect_sentinel()
-                elif self._settings.mode == 'cluster':
-                    await self._connect_cluster()
-                else:
-                    raise ValueError(f"Unsupported Redis mode: {self._settings.mode}")
-                
-                # Test connection
-                await self._test_connection()
-                self._is_connected = True
-                
-                # Start health check task
-                if self._health_check_task is None:
-                    self._health_check_task = asyncio.create_task(
-                        self._health_check_loop()
-                    )
-                
-                logger.info(f"Successfully connected to Redis (attempt {attempt + 1})")
-                return
-                
-            except (ConnectionError, AuthenticationError, TimeoutError) as e:
-                logger.warning(
-                    f"Redis connection attempt {attempt + 1} failed: {str(e)}"
-                )
-                
-                if attempt < self._settings.retry_attempts - 1:
-                    await asyncio.sleep(self._settings.retry_delay)
-                else:
-                    logger.error(f"Failed to connect to Redis after {self._settings.retry_attempts} attempts")
-                    raise RedisError(f"Redis connection failed: {str(e)}")
+        async def attempt() -> None:
+            nonlocal attempts
+            attempts += 1
+            if settings.mode == 'single':
+                await self._connect_single()
+            elif settings.mode == 'sentinel':
+                await self._connect_sentinel()
+            elif settings.mode == 'cluster':
+                await self._connect_cluster()
+            else:
+                raise ValueError(f"Unsupported Redis mode: {settings.mode}")
+            
+            # Test connection
+            await self._test_connection()
+        
+        async def on_failure(error: Exception) -> None:
+            logger.warning(f"Redis connection attempt {attempts} failed: {str(error)}")
+            # Each attempt builds a fresh client and pool; release this one before the next
+            await self._close_connections()
+        
+        # Exponential backoff with jitter keeps many workers from reconnecting in lockstep after a blip
+        retry = Retry(
+            EqualJitterBackoff(cap=5.0, base=settings.retry_delay),
+            retries=settings.retry_attempts - 1,
+            supported_errors=(ConnectionError, AuthenticationError, TimeoutError),
+        )
+        
+        try:
+            await retry.call_with_retry(attempt, on_failure)
+        except (ConnectionError, AuthenticationError, TimeoutError) as e:
+            logger.error(f"Failed to connect to Redis after {attempts} attempts")
+            raise RedisError(f"Redis connection failed: {str(e)}")
+        
+        self._is_connected = True
+        self._last_health_check_ts = time.monotonic()
+        self._execute_command = self._client.execute_command
+        self._ping = self._client.ping
+        
+        # Single-instance pools already PING idle connections via
+        # health_check_interval; only topology-aware modes need a monitor
+        if settings.mode != 'single' and self._health_handle is None and self._health_check_task is None:
+            self._health_interval = settings.health_check_interval
+            self._healthy_checks = 0
+            self._schedule_health_check(self._health_interval)
+        
+        logger.info(f"Successfully connected to Redis (attempt {attempts})")
+    
+    def _build_retry(self) -> Retry:
+        """Per-command retry policy: exponential backoff on the failing connection, no pool rebuild."""
+        return Retry(
+            ExponentialBackoff(cap=1.0, base=0.05),
+            retries=self._settings.retry_attempts if self._settings else 3,
+        )
     
     async def _connect_single(self) -> None:
         """Connect to a single Redis instance."""
         if self._settings is None:
             return
         
+        # Pools take TLS through the connection class, not an ssl= flag
+        pool_kwargs: Dict[str, Any] = {}
+        if self._settings.ssl:
+            pool_kwargs["connection_class"] = SSLConnection
+            if self._settings.ssl_cert_reqs is not None:
+                pool_kwargs["ssl_cert_reqs"] = self._settings.ssl_cert_reqs
+        
+        # RESP parsing sits on every reply's path; pin the C parser rather than rely on auto-detection
+        if HIREDIS_AVAILABLE:
+            pool_kwargs["parser_class"] = _AsyncHiredisParser
+        
         # Create connection pool
         self._connection_pool = ConnectionPool(
             host=self._settings.host,
             port=self._settings.port,
             password=self._settings.password,
             db=self._settings.db,
-            max_connections=self._settings.max_connections,
+            max_connections=self._settings.effective_max_connections,
             socket_connect_timeout=self._settings.timeout,
             socket_timeout=self._settings.timeout,
             health_check_interval=self._settings.health_check_interval,
-            ssl=self._settings.ssl,
-            ssl_cert_reqs=self._settings.ssl_cert_reqs,
             decode_responses=self._settings.decode_responses,
             retry_on_timeout=True,
             retry_on_error=[ConnectionError, TimeoutError],
+            retry=self._build_retry(),
+            **pool_kwargs,
         )
         
         # Create Redis client
@@ -254,16 +374,11 @@ class RedisConnectionManager:
         if self._settings is None:
             return
         
-        if not self._settings.sentinel_master or not self._settings.sentinel_nodes:
-            raise ValueError("Sentinel mode requires master name and nodes configuration")
-        
-        # Parse sentinel nodes
-        sentinel_nodes = self._settings.parse_sentinel_nodes(
-            self._settings.sentinel_nodes, {'mode': 'sentinel'}
-        )
+        # Parsed into (host, port) pairs once, when the settings were loaded
+        sentinel_nodes = self._settings._parsed_sentinel_nodes
         
-        if not sentinel_nodes:
-            raise ValueError("Invalid sentinel nodes configuration")
+        if not self._settings.sentinel_master or not sentinel_nodes:
+            raise ValueError("Sentinel mode requires master name and nodes configuration")
         
         # Create Sentinel client
         sentinel = Sentinel(
@@ -282,6 +397,7 @@ class RedisConnectionManager:
             password=self._settings.password,
             db=self._settings.db,
             decode_responses=self._settings.decode_responses,
+            retry=self._build_retry(),
         )
     
     async def _connect_cluster(self) -> None:
@@ -296,12 +412,17 @@ class RedisConnectionManager:
             password=self._settings.password,
             socket_timeout=self._settings.timeout,
             socket_connect_timeout=self._settings.timeout,
-            max_connections=self._settings.max_connections,
+            max_connections=self._settings.effective_max_connections,
             decode_responses=self._settings.decode_responses,
             ssl=self._settings.ssl,
             ssl_cert_reqs=self._settings.ssl_cert_reqs,
-            skip_full_coverage_check=True,
+            # Refresh the slot map only after 10 MOVED replies rather than on every redirect
+            reinitialize_steps=10,
+            retry=self._build_retry(),
         )
+        
+        # Load the slot map now so the first command to each slot is routed in one round trip
+        await self._client.initialize()
     
     async def _test_connection(self) -> None:
         """Test Redis connection with a simple PING command."""
@@ -310,45 +431,82 @@ class RedisConnectionManager:
         
         try:
             response = await self._client.ping()
-            if response != True:  # noqa: E712
-                raise RedisError(f"Unexpected PING response: {response}")
+        except (ConnectionError, AuthenticationError, TimeoutError):
+            raise
         except Exception as e:
             raise RedisError(f"Redis connection test failed: {str(e)}")
+        
+        if response != True:  # noqa: E712
+            raise RedisError(f"Unexpected PING response: {response}")
     
-    async def _health_check_loop(self) -> None:
-        """Background task to periodically check Redis connection health."""
+    def _has_active_traffic(self) -> bool:
+        """Check whether commands are in flight, which already proves the connection is alive."""
+        pool = getattr(self._client, "connection_pool", None)
+        return bool(getattr(pool, "_in_use_connections", None))
+    
+    def _schedule_health_check(self, delay: float) -> None:
+        """Arm the next health check; a timer handle is cheaper for the loop than a sleeping task."""
+        self._health_handle = asyncio.get_running_loop().call_later(delay, self._start_health_check)
+    
+    def _start_health_check(self) -> None:
+        """Timer callback: run one health check as a short-lived task."""
+        self._health_handle = None
+        self._health_check_task = asyncio.get_running_loop().create_task(self._do_health_check())
+    
+    async def _do_health_check(self) -> None:
+        """
+        Check sentinel/cluster connection health once, then re-arm the timer.
+        
+        The interval starts at health_check_interval and doubles, up to
+        HEALTH_CHECK_MAX_BACKOFF times that, once the connection has stayed
+        healthy for HEALTH_CHECK_IDLE_CYCLES checks in a row. Any failure
+        resets it.
+        """
         if self._settings is None:
             return
         
-        while True:
-            try:
-                await asyncio.sleep(self._settings.health_check_interval)
-                
-                if self._client is None:
-                    logger.warning("Redis client is None, attempting to reconnect...")
-                    await self.reconnect()
-                    continue
-                
-                # Perform health check
+        base_interval = self._settings.health_check_interval
+        max_interval = base_interval * HEALTH_CHECK_MAX_BACKOFF
+        delay = self._health_interval
+        
+        try:
+            if self._client is None:
+                logger.warning("Redis client is None, attempting to reconnect...")
+                self._health_interval, self._healthy_checks = base_interval, 0
+                await self.reconnect()
+            # Real traffic proves liveness; only PING an idle connection
+            elif not self._has_active_traffic():
                 try:
                     await self._client.ping()
+                    self._last_health_check_ts = time.monotonic()
                     if not self._is_connected:
                         self._is_connected = True
                         logger.info("Redis connection restored")
+                    self._healthy_checks += 1
                 except (ConnectionError, TimeoutError) as e:
                     if self._is_connected:
                         self._is_connected = False
                         logger.error(f"Redis connection lost: {str(e)}")
                     
-                    # Attempt reconnection
+                    self._health_interval, self._healthy_checks = base_interval, 0
                     await self.reconnect()
-                    
-            except asyncio.CancelledError:
-                logger.info("Redis health check loop cancelled")
-                break
-            except Exception as e:
-                logger.error(f"Error in Redis health check loop: {str(e)}")
-                await asyncio.sleep(5)  # Prevent tight error loop
+            else:
+                self._last_health_check_ts = time.monotonic()
+                self._healthy_checks += 1
+            
+            if self._healthy_checks >= HEALTH_CHECK_IDLE_CYCLES:
+                self._health_interval = min(self._health_interval * 2, max_interval)
+            delay = self._health_interval
+        except asyncio.CancelledError:
+            logger.info("Redis health check cancelled")
+            self._health_check_task = None
+            raise
+        except Exception as e:
+            logger.error(f"Error in Redis health check: {str(e)}")
+            delay = 5  # Prevent tight error loop
+        
+        self._health_check_task = None
+        self._schedule_health_check(delay)
     
     async def reconnect(self) -> None:
         """
@@ -356,11 +514,11 @@ class RedisConnectionManager:
         
         This method closes existing connections and establishes new ones.
         """
-        async with self._connection_lock:
+        async with self._lock():
             logger.info("Attempting Redis reconnection...")
             
-            # Close existing connections
-            await self.close()
+            # Close existing connections; the health check task may be the caller, so keep it
+            await self._close_connections()
             
             # Clear client reference
             self._client = None
@@ -377,8 +535,11 @@ class RedisConnectionManager:
     
     async def close(self) -> None:
         """Close Redis connections and cleanup resources."""
-        async with self._connection_lock:
-            # Cancel health check task
+        async with self._lock():
+            # Disarm the health check timer and stop any check in flight
+            if self._health_handle is not None:
+                self._health_handle.cancel()
+                self._health_handle = None
             if self._health_check_task:
                 self._health_check_task.cancel()
                 try:
@@ -387,27 +548,34 @@ class RedisConnectionManager:
                     pass
                 self._health_check_task = None
             
-            # Close client
-            if self._client:
-                try:
-                    await self._client.close()
-                    logger.info("Redis client closed")
-                except Exception as e:
-                    logger.error(f"Error closing Redis client: {str(e)}")
-                finally:
-                    self._client = None
-            
-            # Close connection pool
-            if self._connection_pool:
-                try:
-                    await self._connection_pool.disconnect()
-                    logger.info("Redis connection pool disconnected")
-                except Exception as e:
-                    logger.error(f"Error disconnecting Redis pool: {str(e)}")
-                finally:
-                    self._connection_pool = None
-            
-            self._is_connected = False
+            await self._close_connections()
+    
+    async def _close_connections(self) -> None:
+        """Close the client and pool; callers hold the connection lock."""
+        self._execute_command = None
+        self._ping = None
+        
+        # Close client
+        if self._client:
+            try:
+                await self._client.close()
+                logger.info("Redis client closed")
+            except Exception as e:
+                logger.error(f"Error closing Redis client: {str(e)}")
+            finally:
+                self._client = None
+        
+        # Close connection pool
+        if self._connection_pool:
+            try:
+                await self._connection_pool.disconnect()
+                logger.info("Redis connection pool disconnected")
+            except Exception as e:
+                logger.error(f"Error disconnecting Redis pool: {str(e)}")
+            finally:
+                self._connection_pool = None
+        
+        self._is_connected = False
     
     def is_connected(self) -> bool:
         """Check if Redis is currently connected."""
@@ -419,7 +587,10 @@ class RedisConnectionManager:
     
     async def execute_command(self, *args: Any, **kwargs: Any) -> Any:
         """
-        Execute a Redis command with automatic reconnection.
+        Execute a Redis command.
+        
+        Transient connection errors are retried with exponential backoff by
+        the connection itself; the pool is never rebuilt from this path.
         
         Args:
             *args: Command arguments
@@ -431,24 +602,83 @@ class RedisConnectionManager:
         Raises:
             RedisError: If command execution fails
         """
-        client = await self.get_client()
+        execute = self._execute_command
+        if execute is None:
+            execute = (await self.get_client()).execute_command
         
         try:
-            return await client.execute_command(*args, **kwargs)
+            return await execute(*args, **kwargs)
         except (ConnectionError, TimeoutError) as e:
-            logger.warning(f"Redis command failed, attempting reconnection: {str(e)}")
-            await self.reconnect()
-            
-            # Retry with reconnected client
-            client = await self.get_client()
-            return await client.execute_command(*args, **kwargs)
+            # The server stopped answering: make redis_ping() do a real round trip next time
+            self._last_health_check_ts = 0.0
+            logger.error(f"Redis command execution error: {str(e)}")
+            raise RedisError(f"Redis command failed: {str(e)}")
         except Exception as e:
             logger.error(f"Redis command execution error: {str(e)}")
             raise RedisError(f"Redis command failed: {str(e)}")
+    
+    async def execute_pipeline(self, commands: Sequence[Tuple[Any, ...]]) -> List[Any]:
+        """
+        Execute many Redis commands with one round-trip per batch.
+        
+        Commands are sent in non-transactional pipelines of at most
+        ``max_pipeline_size`` commands to bound reply-buffer memory.
+        
+        Args:
+            commands: Command tuples, e.g. ``("SET", "key", "value")``
+            
+        Returns:
+            Command responses, in the order the commands were given
+        """
+        client = await self.get_client()
+        batch_size = _get_settings().max_pipeline_size
+        results: List[Any] = []
+        
+        try:
+            for start in range(0, len(commands), batch_size):
+                async with client.pipeline(transaction=False) as pipe:
+                    for command in commands[start:start + batch_size]:
+                        pipe.execute_command(*command)
+                    results.extend(await pipe.execute())
+        except (ConnectionError, TimeoutError):
+            self._last_health_check_ts = 0.0
+            raise
+        
+        return results
 
 
-# Global Redis connection manager instance
-_redis_manager: Optional[RedisConnectionManager] = None
+# Current manager for this context; checked first on every lookup
+_redis_manager: ContextVar[Optional[RedisConnectionManager]] = ContextVar("redis_manager", default=None)
+# Contexts don't flow between sibling tasks (e.g. lifespan and request handlers),
+# so managers are also registered per loop and dropped when the loop is collected
+_loop_managers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, RedisConnectionManager]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_manager() -> RedisConnectionManager:
+    """
+    Get the connection manager for the running event loop, creating it on first use.
+    
+    Each loop gets its own manager, so connections and locks are never
+    shared across loops. Construction never awaits, so concurrent callers
+    on one loop cannot race past each other and build two managers.
+    """
+    manager = _redis_manager.get()
+    try:
+        loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    
+    if manager is None or (loop is not None and manager._loop is not loop):
+        manager = _loop_managers.get(loop) if loop is not None else None
+        if manager is None:
+            manager = RedisConnectionManager()
+            if loop is not None:
+                _loop_managers[loop] = manager
+        _redis_manager.set(manager)
+    
+    return manager
 
 
 async def get_redis() -> Union[Redis, RedisCluster]:
@@ -462,23 +692,25 @@ async def get_redis() -> Union[Redis, RedisCluster]:
     Returns:
         Redis or RedisCluster client
     """
-    global _redis_manager
-    
-    if _redis_manager is None:
-        _redis_manager = RedisConnectionManager()
-    
-    return await _redis_manager.get_client()
+    return await _get_manager().get_client()
 
 
 async def init_redis() -> None:
     """Initialize Redis connection on application startup."""
-    global _redis_manager
-    
-    if _redis_manager is None:
-        _redis_manager = RedisConnectionManager()
+    manager = _get_manager()
     
     try:
-        await _redis_manager.get_client()
+        await manager.get_client()
+        
+        # Open min_idle_connections sockets in parallel now so early requests skip the handshake;
+        # the cluster client manages its own sockets and has no pool here
+        pool = manager._connection_pool
+        settings = _get_settings()
+        warm = min(settings.min_idle_connections, settings.effective_max_connections)
+        if warm and pool is not None and hasattr(pool, 'get_connection'):
+            connections = await asyncio.gather(*(pool.get_connection("PING") for _ in range(warm)))
+            await asyncio.gather(*(pool.release(connection) for connection in connections))
+        
         logger.info("Redis initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize Redis: {str(e)}")
@@ -487,11 +719,10 @@ async def init_redis() -> None:
 
 async def close_redis() -> None:
     """Close Redis connection on application shutdown."""
-    global _redis_manager
-    
-    if _redis_manager:
-        await _redis_manager.close()
-        _redis_manager = None
+    manager = _loop_managers.pop(asyncio.get_running_loop(), None)
+    _redis_manager.set(None)
+    if manager is not None:
+        await manager.close()
         logger.info("Redis connections closed")
 
 
@@ -502,30 +733,57 @@ def get_redis_manager() -> RedisConnectionManager:
     Returns:
         RedisConnectionManager instance
     """
-    global _redis_manager
-    
-    if _redis_manager is None:
-        _redis_manager = RedisConnectionManager()
-    
-    return _redis_manager
+    return _get_manager()
 
 
 # Convenience functions for common operations
 async def redis_ping() -> bool:
-    """Check if Redis is responsive."""
+    """
+    Check if Redis is responsive.
+    
+    Answers from the manager's liveness flag while the last successful
+    check is younger than health_check_interval, so frequent readiness
+    probes cost no round trip; otherwise falls back to redis_ping_deep().
+    Single mode has no health-check timer, so there the flag is only
+    trusted until a command fails with a connection error.
+    """
+    manager = get_redis_manager()
+    settings = manager._settings
+    if (
+        manager._is_connected
+        and settings is not None
+        and time.monotonic() - manager._last_health_check_ts < settings.health_check_interval
+    ):
+        return True
+    return await redis_ping_deep()
+
+
+async def redis_ping_deep() -> bool:
+    """Check if Redis is responsive with a real PING round trip."""
+    manager = get_redis_manager()
     try:
-        client = await get_redis()
-        return await client.ping()
+        ping = manager._ping
+        if ping is None:
+            ping = (await get_redis()).ping
+        await ping()
+        manager._last_health_check_ts = time.monotonic()
+        return True
     except Exception:
+        manager._last_health_check_ts = 0.0
         return False
 
 
-async def redis_info() -> Dict[str, Any]:
+async def redis_info(section: Optional[str] = None) -> Dict[str, Any]:
     """
     Get Redis server information.
     
+    Args:
+        section: INFO section to fetch (e.g. "memory", "clients"); the
+            full report is much larger to format and parse
+    
     Returns:
-        Dictionary with Redis server info
+        Dictionary with Redis server info (str keys regardless of
+        REDIS_DECODE_RESPONSES; redis-py decodes INFO itself)
         
     Raises:
         RedisError: If info command fails
@@ -533,15 +791,72 @@ async def redis_info() -> Dict[str, Any]:
     client = await get_redis()
     
     try:
-        info = await client.info()
+        info = await client.info(section)
         return cast(Dict[str, Any], info)
     except Exception as e:
         raise RedisError(f"Failed to get Redis info: {str(e)}")
 
 
+async def redis_mget(keys: Sequence[str]) -> List[Any]:
+    """
+    Get many keys in one MGET round-trip.
+    
+    In cluster mode keys are grouped by hash slot and each slot's MGET is
+    sent in parallel, since a single MGET cannot span slots.
+    
+    Args:
+        keys: Keys to read
+        
+    Returns:
+        Values in key order (bytes unless REDIS_DECODE_RESPONSES is set),
+        None for missing keys
+    """
+    if not keys:
+        return []
+    
+    client = await get_redis()
+    if _get_settings().mode == 'cluster':
+        return await client.mget_nonatomic(keys)
+    return await client.mget(keys)
+
+
+async def redis_mset(mapping: Dict[str, Any]) -> bool:
+    """
+    Set many keys in one MSET round-trip.
+    
+    In cluster mode keys are grouped by hash slot, one MSET per slot.
+    
+    Args:
+        mapping: Key/value pairs to write
+        
+    Returns:
+        True if every key was set
+    """
+    if not mapping:
+        return True
+    
+    client = await get_redis()
+    if _get_settings().mode == 'cluster':
+        return all(await client.mset_nonatomic(mapping))
+    return bool(await client.mset(mapping))
+
+
 async def redis_flushdb(async_mode: bool = True) -> bool:
     """
     Flush the current Redis database.
     
     Args:
-        async_mode: Use asynchronous flush (default:
\ No newline at end of file
+        async_mode: Use asynchronous flush (default: True)
+    
+    Returns:
+        True if the database was flushed
+        
+    Raises:
+        RedisError: If flush command fails
+    """
+    client = await get_redis()
+    
+    try:
+        return await client.flushdb(asynchronous=async_mode)
+    except Exception as e:
+        raise RedisError(f"Failed to flush Redis database: {str(e)}")
@@ -162,33 +162,38 @@ export const useWebSocket = (options: WebSocketOptions): WebSocketHookReturn =>
 
   const handleMessage = useCallback((event: MessageEvent) => {
     try {
-      const data = JSON.parse(event.data);
+      const parsed = JSON.parse(event.data);
       
-      const message: WebSocketMessage = {
-        type: data.type,
-        payload: data.payload,
-        timestamp: data.timestamp || Date.now(),
-        id: data.id,
-      };
-
-      log('log', 'Message received', message);
+      // The server batches bursts of messages into a single JSON array frame
+      const frames = Array.isArray(parsed) ? parsed : [parsed];
       
-      setLastMessage(message);
-      setMessageHistory(prev => {
-        const newHistory = [message, ...prev];
-        return newHistory.slice(0, maxMessageQueueSize);
-      });
-      
-      if (onMessage) {
-        onMessage(message);
-      }
+      for (const data of frames) {
+        const message: WebSocketMessage = {
+          type: data.type,
+          payload: data.payload,
+          timestamp: data.timestamp || Date.now(),
+          id: data.id,
+        };
+
+        log('log', 'Message received', message);
+        
+        setLastMessage(message);
+        setMessageHistory(prev => {
+          const newHistory = [message, ...prev];
+          return newHistory.slice(0, maxMessageQueueSize);
+        });
+        
+        if (onMessage) {
+          onMessage(message);
+        }
 
-      if (message.id && pendingSendsRef.current.has(message.id)) {
-        const pending = pendingSendsRef.current.get(message.id);
-        if (pending) {
-          clearTimeout(pending.timeoutId);
-          pending.resolve(true);
-          pendingSendsRef.current.delete(message.id);
+        if (message.id && pendingSendsRef.current.has(message.id)) {
+          const pending = pendingSendsRef.current.get(message.id);
+          if (pending) {
+            clearTimeout(pending.timeoutId);
+            pending.resolve(true);
+            pendingSendsRef.current.delete(message.id);
+          }
         }
       }
     } catch (err) {
@@ -536,17 +536,23 @@ export class WebSocketService {
    */
   private handleMessage(event: MessageEvent): void {
     try {
-      const message: WebSocketMessage = JSON.parse(event.data);
-      this.stats.messagesReceived++;
+      const parsed: WebSocketMessage | WebSocketMessage[] = JSON.parse(event.data);
       
-      this.log('Message received:', message);
+      // The server batches bursts of messages into a single JSON array frame
+      const messages = Array.isArray(parsed) ? parsed : [parsed];
       
-      // Emit raw message event
-      this.emit(WebSocketEvent.MESSAGE, message);
-      
-      // Emit typed event if message has a type
-      if (message.type) {
-        this.emit(message.type, message.data);
+      for (const message of messages) {
+        this.stats.messagesReceived++;
+        
+        this.log('Message received:', message);
+        
+        // Emit raw message event
+        this.emit(WebSocketEvent.MESSAGE, message);
+        
+        // Emit typed event if message has a type
+        if (message.type) {
+          this.emit(message.type, message.data);
+        }
       }
       
     } catch (error) {
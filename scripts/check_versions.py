@@ -18,27 +18,39 @@ Features:
 """
 
 import argparse
+import asyncio
+import importlib.metadata
 import json
 import logging
 import os
 import re
+import sqlite3
 import subprocess
 import sys
+import threading
+import time
 import warnings
-from collections import defaultdict
-from dataclasses import dataclass, field, asdict
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple, Union, Any
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Union, Any
 from packaging import version
-from packaging.requirements import Requirement
+from packaging.requirements import InvalidRequirement, Requirement
 from packaging.specifiers import SpecifierSet
-import yaml
+
 try:
-    import tomllib
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    import tomli as tomllib
+    ORJSON_AVAILABLE = False
+
+# Both accept the raw bytes of a subprocess or HTTP body, so nothing is decoded to str first;
+# orjson.JSONDecodeError subclasses json.JSONDecodeError
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
 
 # Configure logging
 logging.basicConfig(
@@ -48,6 +60,72 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Exact pins ("name==1.2.3", optionally with a marker) make up most of a lock file
+# and can skip the full requirement grammar
+_PINNED = re.compile(r'^([A-Za-z0-9_.\-]+)==([A-Za-z0-9_.\-+!]+)\s*(?:;.*)?$')
+
+
+# Keep pip subprocesses from checking PyPI for a newer pip, prompting, or writing .pyc files
+_PIP_ENV_OVERRIDES = {
+    'PIP_DISABLE_PIP_VERSION_CHECK': '1',
+    'PIP_NO_INPUT': '1',
+    'PYTHONDONTWRITEBYTECODE': '1',
+}
+
+
+@lru_cache(maxsize=1)
+def _pip_env() -> Dict[str, str]:
+    """Environment for pip subprocesses, built once per run."""
+    return {**os.environ, **_PIP_ENV_OVERRIDES}
+
+
+# Fields of interest in pip show output (one block per package)
+_PIP_SHOW_FIELD = re.compile(r'^(Location|Requires|Name|Version):[ \t]*(.*?)\r?$', re.M)
+
+# Core metadata header fields read from dist-info METADATA files
+_METADATA_FIELD = re.compile(rb'^(Name|Version|Requires-Dist):[ \t]*([^\r\n]*)', re.M)
+_METADATA_HEADER_END = re.compile(rb'\r?\n\r?\n')
+
+
+@lru_cache(maxsize=1)
+def _get_tomllib() -> Any:
+    """Import the TOML parser on first use; only pyproject loading needs it."""
+    try:
+        import tomllib
+    except ImportError:
+        import tomli as tomllib
+    return tomllib
+
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep a per-instance __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+# Stand-in for missing or unparseable versions
+_ZERO_VERSION = version.parse("0.0.0")
+
+
+@lru_cache(maxsize=4096)
+def _parse_version(version_str: str) -> version.Version:
+    """Parse a version string, falling back to 0.0.0 for missing or invalid versions."""
+    try:
+        return version.parse(version_str) if version_str else _ZERO_VERSION
+    except version.InvalidVersion:
+        return _ZERO_VERSION
+
+
+@lru_cache(maxsize=4096)
+def _parse_spec(specifier_str: str) -> SpecifierSet:
+    """Parse a version specifier; the same few specifiers recur across a requirement set."""
+    return SpecifierSet(specifier_str)
+
+
+@lru_cache(maxsize=4096)
+def _spec_contains(specifier_str: str, version_str: str) -> bool:
+    """Check whether a version satisfies a specifier, caching each (specifier, version) pair."""
+    return _parse_spec(specifier_str).contains(version_str)
+
+
 class PackageSource(Enum):
     """Enumeration of package sources."""
     PYPI = "pypi"
@@ -66,7 +144,12 @@ class CompatibilityStatus(Enum):
     WARNING = "warning"
 
 
-@dataclass
+# Enum values looked up by member, for the serialization hot path
+_SOURCE_STR = {s: s.value for s in PackageSource}
+_STATUS_STR = {s: s.value for s in CompatibilityStatus}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class PackageInfo:
     """Data class representing package information."""
     name: str
@@ -87,11 +170,8 @@ class PackageInfo:
     
     @property
     def parsed_version(self) -> version.Version:
-        """Get parsed version object."""
-        try:
-            return version.parse(self.version) if self.version else version.parse("0.0.0")
-        except version.InvalidVersion:
-            return version.parse("0.0.0")
+        """Get parsed version object (cached per version string)."""
+        return _parse_version(self.version)
     
     @property
     def is_installed(self) -> bool:
@@ -99,7 +179,7 @@ class PackageInfo:
         return self.version != "0.0.0" and self.source != PackageSource.UNKNOWN
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class CompatibilityResult:
     """Data class representing compatibility check result."""
     package: PackageInfo
@@ -111,12 +191,97 @@ class CompatibilityResult:
     conflicts: List[Dict[str, str]] = field(default_factory=list)
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        result = asdict(self)
-        result['package'] = asdict(self.package)
-        result['status'] = self.status.value
-        result['package']['source'] = self.package.source.value
-        return result
+        """Convert to dictionary for serialization; lists are shared, not copied."""
+        package = self.package
+        return {
+            'package': {
+                'name': package.name,
+                'version': package.version,
+                'source': _SOURCE_STR[package.source],
+                'required_version': package.required_version,
+                'dependencies': package.dependencies,
+                'location': package.location,
+                'summary': package.summary,
+            },
+            'status': _STATUS_STR[self.status],
+            'message': self.message,
+            'required_specifier': self.required_specifier,
+            'installed_version': self.installed_version,
+            'available_versions': self.available_versions,
+            'conflicts': self.conflicts,
+        }
+
+
+# Worker threads for PyPI lookups when aiohttp cannot be used
+PYPI_FETCH_WORKERS = 16
+
+# PyPI release lists younger than this are used without asking PyPI at all;
+# older ones are revalidated with their ETag
+PYPI_CACHE_MAX_AGE = 24 * 60 * 60
+
+
+@dataclass
+class CachedReleases:
+    """Release list of one package as last served by PyPI."""
+    etag: Optional[str]
+    versions: List[str]
+    fresh: bool
+
+
+class PyPICache:
+    """SQLite cache of PyPI release lists under ~/.cache/ai-scanner/pypi/."""
+    
+    def __init__(self, path: Optional[Path] = None, max_age: float = PYPI_CACHE_MAX_AGE):
+        """
+        Open (or create) the cache database.
+        
+        Args:
+            path: Database file (default: $XDG_CACHE_HOME/ai-scanner/pypi/releases.sqlite3)
+            max_age: Seconds an entry is served without revalidation
+        """
+        if path is None:
+            cache_home = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache')
+            path = cache_home / 'ai-scanner' / 'pypi' / 'releases.sqlite3'
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        self.max_age = max_age
+        # Shared with the lookup thread pool; the lock serializes access to the connection
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), isolation_level=None, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS releases "
+            "(name TEXT PRIMARY KEY, etag TEXT, versions TEXT, fetched_at REAL)"
+        )
+    
+    def get(self, pkg_name: str) -> Optional[CachedReleases]:
+        """Get the cached release list of a package, if any."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, versions, fetched_at FROM releases WHERE name = ?", (pkg_name,)
+            ).fetchone()
+        if row is None:
+            return None
+        etag, versions, fetched_at = row
+        return CachedReleases(
+            etag=etag,
+            versions=_json_loads(versions),
+            fresh=time.time() - fetched_at < self.max_age
+        )
+    
+    def put(self, pkg_name: str, etag: Optional[str], versions: List[str]) -> None:
+        """Store a release list freshly served by PyPI."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO releases (name, etag, versions, fetched_at) VALUES (?, ?, ?, ?)",
+                (pkg_name, etag, json.dumps(versions), time.time())
+            )
+    
+    def touch(self, pkg_name: str) -> None:
+        """Mark an entry fresh again after PyPI answered 304 Not Modified."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE releases SET fetched_at = ? WHERE name = ?", (time.time(), pkg_name)
+            )
 
 
 class VersionChecker:
@@ -133,7 +298,39 @@ class VersionChecker:
         self.packages: Dict[str, PackageInfo] = {}
         self.results: List[CompatibilityResult] = []
         self.environment_info: Dict[str, Any] = {}
+        # Metadata of the running interpreter can be read in-process; any other needs pip
+        self._in_process = self._is_running_interpreter(self.python_path)
+        self._scanned: Optional[Tuple[Dict[str, PackageInfo], Dict[str, Set[str]]]] = None
+        # Opened on the first PyPI lookup; False once opening it has failed
+        self._pypi_cache: Union[PyPICache, None, bool] = None
+        # Strongly connected components of the dependency graph, filled by _find_cycles()
+        self._scc_of: Dict[str, int] = {}
+        self._scc_members: List[List[str]] = []
+        self._scc_cycles: List[FrozenSet[int]] = []
+        self._cycle_paths: Dict[int, str] = {}
+        # Graph the component maps above were computed for, and the pip show graph once read
+        self._cycles_graph: Optional[Dict[str, Set[str]]] = None
+        self._pip_dependency_graph: Optional[Dict[str, Set[str]]] = None
         
+    @staticmethod
+    def _is_running_interpreter(python_path: str) -> bool:
+        """Whether python_path is this process's interpreter, so its metadata can be read in-process."""
+        if os.path.abspath(python_path) == os.path.abspath(sys.executable):
+            return True
+        # A venv's bin/python symlinks to the base interpreter; only the prefix tells them apart
+        if os.path.realpath(python_path) != os.path.realpath(sys.executable):
+            return False
+        try:
+            result = subprocess.run(
+                [python_path, "-c", "import sys; print(sys.prefix)"],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        except (OSError, subprocess.CalledProcessError):
+            return False
+        return os.path.realpath(result.stdout.strip()) == os.path.realpath(sys.prefix)
+    
     def load_environment(self) -> Dict[str, PackageInfo]:
         """
         Load all installed packages from current environment.
@@ -143,23 +340,29 @@ class VersionChecker:
         """
         logger.info("Loading environment packages...")
         
+        if self._in_process:
+            self.packages.update(self._scan_distributions()[0])
+            self._load_conda_packages()
+            logger.info(f"Loaded {len(self.packages)} packages from environment")
+            return self.packages
+        
         try:
-            # Use pip list to get installed packages
+            # Use pip list to get installed packages; --verbose adds each one's location
             result = subprocess.run(
-                [self.python_path, "-m", "pip", "list", "--format=json"],
+                [self.python_path, "-m", "pip", "list", "--format=json", "--verbose"],
                 capture_output=True,
-                text=True,
-                check=True
+                check=True,
+                env=_pip_env()
             )
             
-            packages_data = json.loads(result.stdout)
+            packages_data = _json_loads(result.stdout)
             
             for pkg in packages_data:
                 package_info = PackageInfo(
                     name=pkg['name'],
                     version=pkg['version'],
                     source=PackageSource.PYPI,
-                    location=self._get_package_location(pkg['name'])
+                    location=pkg.get('location')
                 )
                 self.packages[pkg['name'].lower()] = package_info
                 
@@ -174,6 +377,75 @@ class VersionChecker:
         logger.info(f"Loaded {len(self.packages)} packages from environment")
         return self.packages
     
+    def _scan_distributions(self) -> Tuple[Dict[str, PackageInfo], Dict[str, Set[str]]]:
+        """
+        Read every installed distribution of the running interpreter in one pass.
+        
+        Returns:
+            Tuple of (package name to PackageInfo, package name to the names it requires)
+        """
+        if self._scanned is not None:
+            return self._scanned
+        
+        packages: Dict[str, PackageInfo] = {}
+        dependency_graph: Dict[str, Set[str]] = defaultdict(set)
+        
+        # Walk sys.path the way importlib.metadata does, but read dist-info METADATA
+        # headers directly instead of materializing a Distribution per package
+        for entry in sys.path:
+            location = entry or '.'
+            try:
+                dirnames = os.listdir(location)
+            except OSError:
+                continue  # Missing directory or zip archive
+            
+            for dirname in dirnames:
+                if dirname.endswith('.dist-info'):
+                    try:
+                        data = Path(location, dirname, 'METADATA').read_bytes()
+                    except OSError:
+                        continue
+                    name = dist_version = None
+                    requires = []
+                    for key, value in _METADATA_FIELD.findall(_METADATA_HEADER_END.split(data, 1)[0]):
+                        if key == b'Requires-Dist':
+                            requires.append(value.decode('utf-8', 'replace'))
+                        elif key == b'Name':
+                            name = value.decode('utf-8', 'replace').strip()
+                        else:
+                            dist_version = value.decode('utf-8', 'replace').strip()
+                elif dirname.endswith('.egg-info'):
+                    dist = importlib.metadata.PathDistribution(Path(location, dirname))
+                    name, dist_version, requires = dist.metadata['Name'], dist.version, dist.requires or []
+                else:
+                    continue
+                
+                if not name:
+                    continue
+                pkg_name = name.lower()
+                if pkg_name in packages:
+                    continue  # Shadowed by an earlier sys.path entry, as pip reports it
+                
+                packages[pkg_name] = PackageInfo(
+                    name=name,
+                    version=dist_version or '',
+                    source=PackageSource.PYPI,
+                    location=str(Path(location).resolve())
+                )
+                
+                for req_str in requires:
+                    try:
+                        req = Requirement(req_str)
+                    except InvalidRequirement:
+                        continue
+                    # Extra-only requirements are not installed by default; pip show omits them too
+                    if req.marker is not None and not req.marker.evaluate({'extra': ''}):
+                        continue
+                    dependency_graph[pkg_name].add(req.name.lower())
+        
+        self._scanned = (packages, dependency_graph)
+        return self._scanned
+    
     def _load_packages_fallback(self) -> None:
         """Fallback method to load packages using pkg_resources."""
         try:
@@ -201,11 +473,10 @@ class VersionChecker:
             result = subprocess.run(
                 ['conda', 'list', '--json'],
                 capture_output=True,
-                text=True,
                 check=True
             )
             
-            conda_packages = json.loads(result.stdout)
+            conda_packages = _json_loads(result.stdout)
             
             for pkg in conda_packages:
                 package_info = PackageInfo(
@@ -219,25 +490,6 @@ class VersionChecker:
         except (subprocess.CalledProcessError, FileNotFoundError, json.JSONDecodeError):
             pass  # Not a conda environment or conda not available
     
-    def _get_package_location(self, package_name: str) -> Optional[str]:
-        """Get installation location of a package."""
-        try:
-            result = subprocess.run(
-                [self.python_path, "-m", "pip", "show", package_name],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            for line in result.stdout.split('\n'):
-                if line.startswith('Location:'):
-                    return line.split(':', 1)[1].strip()
-                    
-        except subprocess.CalledProcessError:
-            pass
-            
-        return None
-    
     def load_requirements(self, requirements_file: str) -> Dict[str, str]:
         """
         Load requirements from a file.
@@ -257,19 +509,23 @@ class VersionChecker:
         
         logger.info(f"Loading requirements from {requirements_file}")
         
-        with open(file_path, 'r') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                
-                # Skip comments and empty lines
-                if not line or line.startswith('#'):
-                    continue
-                
-                try:
-                    req = Requirement(line)
-                    requirements[req.name.lower()] = str(req.specifier) if req.specifier else ""
-                except Exception as e:
-                    logger.warning(f"Line {line_num}: Could not parse requirement '{line}': {e}")
+        for line_num, line in enumerate(file_path.read_text().splitlines(), 1):
+            line = line.strip()
+            
+            # Skip comments and empty lines
+            if not line or line.startswith('#'):
+                continue
+            
+            pinned = _PINNED.match(line)
+            if pinned:
+                requirements[pinned.group(1).lower()] = f"=={pinned.group(2)}"
+                continue
+            
+            try:
+                req = Requirement(line)
+                requirements[req.name.lower()] = str(req.specifier) if req.specifier else ""
+            except Exception as e:
+                logger.warning(f"Line {line_num}: Could not parse requirement '{line}': {e}")
         
         logger.info(f"Loaded {len(requirements)} requirements")
         return requirements
@@ -295,7 +551,7 @@ class VersionChecker:
         
         try:
             with open(file_path, 'rb') as f:
-                data = tomllib.load(f)
+                data = _get_tomllib().load(f)
             
             # Check for dependencies in various sections
             project_deps = data.get('project', {}).get('dependencies', [])
@@ -330,13 +586,17 @@ class VersionChecker:
     
     def check_compatibility(self, 
                            requirements: Dict[str, str],
-                           check_dependencies: bool = False) -> List[CompatibilityResult]:
+                           check_dependencies: bool = False,
+                           fetch_available: bool = False) -> List[CompatibilityResult]:
         """
         Check compatibility between installed packages and requirements.
         
         Args:
-            requirements: Dictionary of package name to version specifier
+            requirements: Dictionary of lowercased package name to version
+                specifier, as returned by load_requirements()/load_pyproject()
             check_dependencies: Whether to check transitive dependencies
+            fetch_available: Whether to look up PyPI release lists for
+                missing or incompatible packages
             
         Returns:
             List of compatibility results
@@ -348,15 +608,34 @@ class VersionChecker:
         if not self.packages:
             self.load_environment()
         
-        # Check direct requirements
+        # Pass 1: classify direct requirements locally, noting which need PyPI data
+        needs_versions: List[CompatibilityResult] = []
         for pkg_name, specifier_str in requirements.items():
             result = self._check_single_package(pkg_name, specifier_str)
             self.results.append(result)
+            if fetch_available and result.status == CompatibilityStatus.INCOMPATIBLE:
+                needs_versions.append(result)
+        
+        # Pass 2: fetch PyPI data for that subset as one batch; when the conflict check
+        # also runs, the fetch proceeds in the background so network waits overlap it.
+        # The conflict check only touches compatible results, so the two never collide.
+        pkg_names = [r.package.name for r in needs_versions]
+        pending = None
+        if needs_versions and check_dependencies:
+            executor = ThreadPoolExecutor(max_workers=1)
+            pending = executor.submit(self._fetch_available_versions, pkg_names)
+            executor.shutdown(wait=False)
         
         # Check dependency conflicts if requested
         if check_dependencies:
             self._check_dependency_conflicts()
         
+        # Pass 3: attach release lists to their results
+        if needs_versions:
+            available = pending.result() if pending is not None else self._fetch_available_versions(pkg_names)
+            for result in needs_versions:
+                result.available_versions = available.get(result.package.name, [])
+        
         return self.results
     
     def _check_single_package(self, 
@@ -366,13 +645,15 @@ class VersionChecker:
         Check compatibility for a single package.
         
         Args:
-            pkg_name: Package name
+            pkg_name: Lowercased package name
             specifier_str: Version specifier string
             
         Returns:
             CompatibilityResult object
         """
-        installed_pkg = self.packages.get(pkg_name.lower())
+        # Requirement and package keys are lowercased once when loaded
+        assert pkg_name == pkg_name.lower(), f"package name not normalized: {pkg_name!r}"
+        installed_pkg = self.packages.get(pkg_name)
         
         if not installed_pkg:
             # Package not installed
@@ -385,8 +666,7 @@ class VersionChecker:
                 status=CompatibilityStatus.INCOMPATIBLE,
                 message=f"Package '{pkg_name}' is not installed",
                 required_specifier=specifier_str,
-                installed_version=None,
-                available_versions=self._get_available_versions(pkg_name)
+                installed_version=None
             )
         
         if not specifier_str:
@@ -400,9 +680,7 @@ class VersionChecker:
             )
         
         try:
-            specifier = SpecifierSet(specifier_str)
-            
-            if specifier.contains(installed_pkg.version):
+            if _spec_contains(specifier_str, installed_pkg.version):
                 # Version is compatible
                 return CompatibilityResult(
                     package=installed_pkg,
@@ -418,8 +696,7 @@ class VersionChecker:
                     status=CompatibilityStatus.INCOMPATIBLE,
                     message=f"Package '{pkg_name}' version {installed_pkg.version} does not satisfy requirement '{specifier_str}'",
                     required_specifier=specifier_str,
-                    installed_version=installed_pkg.version,
-                    available_versions=self._get_available_versions(pkg_name)
+                    installed_version=installed_pkg.version
                 )
                 
         except Exception as e:
@@ -442,99 +719,319 @@ class VersionChecker:
         Returns:
             List of available version strings
         """
+        cache = self._get_pypi_cache()
+        entry = cache.get(pkg_name) if cache else None
+        if entry is not None and entry.fresh:
+            return entry.versions
+        
         try:
             import requests
             
             response = requests.get(
                 f"https://pypi.org/pypi/{pkg_name}/json",
+                headers=self._revalidation_headers(entry),
                 timeout=5
             )
             
-            if response.status_code == 200:
-                data = response.json()
-                return list(data.get('releases', {}).keys())
+            data = _json_loads(response.content) if response.status_code == 200 else None
+            return self._store_pypi_response(pkg_name, entry, response.status_code,
+                                             response.headers.get('ETag'), data)
                 
         except Exception as e:
             logger.debug(f"Could not fetch versions for {pkg_name}: {e}")
         
-        return []
+        return entry.versions if entry is not None else []
+    
+    def _get_pypi_cache(self) -> Optional[PyPICache]:
+        """Get the on-disk PyPI cache, opening it on first use; None if it is unavailable."""
+        if self._pypi_cache is None:
+            try:
+                self._pypi_cache = PyPICache()
+            except (OSError, sqlite3.Error) as e:
+                logger.debug(f"PyPI cache unavailable, querying PyPI directly: {e}")
+                self._pypi_cache = False
+        return self._pypi_cache or None
+    
+    @staticmethod
+    def _revalidation_headers(entry: Optional[CachedReleases]) -> Dict[str, str]:
+        """Build conditional request headers so an unchanged release list comes back as a 304."""
+        if entry is not None and entry.etag:
+            return {'If-None-Match': entry.etag}
+        return {}
+    
+    def _store_pypi_response(self,
+                             pkg_name: str,
+                             entry: Optional[CachedReleases],
+                             status: int,
+                             etag: Optional[str],
+                             data: Optional[Dict[str, Any]]) -> List[str]:
+        """
+        Turn a PyPI JSON API response into a release list, updating the cache.
+        
+        Args:
+            pkg_name: Package name
+            entry: Cached entry the request was revalidating, if any
+            status: HTTP status code
+            etag: ETag response header
+            data: Decoded body of a 200 response
+            
+        Returns:
+            List of available version strings
+        """
+        cache = self._get_pypi_cache()
+        
+        if status == 304 and entry is not None:
+            if cache:
+                cache.touch(pkg_name)
+            return entry.versions
+        
+        if status == 200 and data is not None:
+            versions = list(data.get('releases', {}).keys())
+            if cache:
+                cache.put(pkg_name, etag, versions)
+            return versions
+        
+        return entry.versions if entry is not None else []
+    
+    def _fetch_available_versions(self, pkg_names: List[str]) -> Dict[str, List[str]]:
+        """
+        Get available versions for several packages from PyPI concurrently.
+        
+        Args:
+            pkg_names: Package names
+            
+        Returns:
+            Dictionary of package name to available version strings
+        """
+        pkg_names = list(dict.fromkeys(pkg_names))
+        
+        try:
+            import aiohttp  # noqa: F401
+            asyncio.get_running_loop()
+        except ImportError:
+            aiohttp_usable = False
+        except RuntimeError:
+            aiohttp_usable = True  # No loop running here, so asyncio.run() is safe
+        else:
+            aiohttp_usable = False
+        
+        # Open the cache here so worker threads never race to create it
+        cache = self._get_pypi_cache()
+        
+        if len(pkg_names) == 1:
+            return {pkg_names[0]: self._get_available_versions(pkg_names[0])}
+        
+        if not aiohttp_usable:
+            # Blocking requests calls still overlap their network waits across threads
+            with ThreadPoolExecutor(max_workers=min(PYPI_FETCH_WORKERS, len(pkg_names))) as executor:
+                return dict(zip(pkg_names, executor.map(self._get_available_versions, pkg_names)))
+        
+        # Fresh cache hits need no request at all
+        available: Dict[str, List[str]] = {}
+        stale: Dict[str, Optional[CachedReleases]] = {}
+        for name in pkg_names:
+            entry = cache.get(name) if cache else None
+            if entry is not None and entry.fresh:
+                available[name] = entry.versions
+            else:
+                stale[name] = entry
+        
+        if stale:
+            available.update(asyncio.run(self._fetch_versions_async(stale)))
+        return available
+    
+    async def _fetch_versions_async(self,
+                                    entries: Dict[str, Optional[CachedReleases]]) -> Dict[str, List[str]]:
+        """Fetch or revalidate PyPI release lists for all packages over one aiohttp session."""
+        import aiohttp
+        
+        async def fetch(session: 'aiohttp.ClientSession', pkg_name: str) -> List[str]:
+            entry = entries[pkg_name]
+            try:
+                async with session.get(f"https://pypi.org/pypi/{pkg_name}/json",
+                                       headers=self._revalidation_headers(entry)) as response:
+                    data = _json_loads(await response.read()) if response.status == 200 else None
+                    return self._store_pypi_response(pkg_name, entry, response.status,
+                                                     response.headers.get('ETag'), data)
+            except Exception as e:
+                logger.debug(f"Could not fetch versions for {pkg_name}: {e}")
+            return entry.versions if entry is not None else []
+        
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5)) as session:
+            versions = await asyncio.gather(*(fetch(session, name) for name in entries))
+        
+        return dict(zip(entries, versions))
     
     def _check_dependency_conflicts(self) -> None:
         """Check for dependency conflicts between installed packages."""
         logger.info("Checking for dependency conflicts...")
         
         # Build dependency graph
-        dependency_graph = defaultdict(set)
+        if self._in_process:
+            dependency_graph = self._scan_distributions()[1]
+        else:
+            if self._pip_dependency_graph is None:
+                self._pip_dependency_graph = self._load_dependency_graph()
+            dependency_graph = self._pip_dependency_graph
         
-        for pkg_name, pkg_info in self.packages.items():
-            try:
-                # Get package dependencies
-                result = subprocess.run(
-                    [self.python_path, "-m", "pip", "show", pkg_name],
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                
-                for line in result.stdout.split('\n'):
-                    if line.startswith('Requires:'):
-                        deps = line.split(':', 1)[1].strip()
-                        if deps:
-                            for dep in deps.split(','):
-                                dep_name = dep.strip().lower()
-                                if dep_name:
-                                    dependency_graph[pkg_name].add(dep_name)
-                                    
-            except subprocess.CalledProcessError:
-                continue
+        # One cycle analysis of the whole graph answers every package below,
+        # and repeated checks against the same environment reuse it
+        if self._cycles_graph is not dependency_graph:
+            self._find_cycles(dependency_graph)
+            self._cycles_graph = dependency_graph
         
         # Check for conflicts
         for result in self.results:
             if result.status == CompatibilityStatus.COMPATIBLE:
-                conflicts = self._find_conflicts_for_package(
-                    result.package.name,
-                    dependency_graph
-                )
+                conflicts = self._find_conflicts_for_package(result.package.name)
                 if conflicts:
                     result.status = CompatibilityStatus.CONFLICT
                     result.message = f"Package '{result.package.name}' has dependency conflicts"
                     result.conflicts = conflicts
     
-    def _find_conflicts_for_package(self, 
-                                   pkg_name: str,
-                                   dependency_graph: Dict[str, Set[str]]) -> List[Dict[str, str]]:
+    def _load_dependency_graph(self) -> Dict[str, Set[str]]:
+        """Read the Requires field of every package with a single pip show call."""
+        dependency_graph = defaultdict(set)
+        if not self.packages:
+            return dependency_graph
+        
+        try:
+            result = subprocess.run(
+                [self.python_path, "-m", "pip", "show", *self.packages],
+                capture_output=True,
+                text=True,
+                env=_pip_env()
+            )
+        except OSError as e:
+            logger.warning(f"Failed to read dependencies via pip: {e}")
+            return dependency_graph
+        
+        # One Name/.../Requires block per package, separated by '---'
+        pkg_name = None
+        for field_name, value in _PIP_SHOW_FIELD.findall(result.stdout):
+            if field_name == 'Name':
+                pkg_name = value.strip().lower()
+            elif field_name == 'Requires' and pkg_name:
+                for dep in value.split(','):
+                    dep_name = dep.strip().lower()
+                    if dep_name:
+                        dependency_graph[pkg_name].add(dep_name)
+        
+        return dependency_graph
+    
+    def _find_cycles(self, dependency_graph: Dict[str, Set[str]]) -> None:
         """
-        Find dependency conflicts for a package.
+        Find every dependency cycle with one iterative Tarjan SCC pass.
+        
+        Fills the node -> component and component -> members maps, and for
+        each component the set of cyclic components reachable from it, so
+        per-package lookups afterwards are O(1).
         
         Args:
-            pkg_name: Package name
             dependency_graph: Dependency graph
-            
-        Returns:
-            List of conflict descriptions
         """
-        conflicts = []
-        visited = set()
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        scc_of: Dict[str, int] = {}
+        sccs: List[List[str]] = []
         
-        def dfs(current_pkg, path):
-            if current_pkg in visited:
-                return
+        for root in list(dependency_graph):
+            if root in index:
+                continue
             
-            visited.add(current_pkg)
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(dependency_graph.get(root, ())))]
             
-            for dep in dependency_graph.get(current_pkg, []):
-                if dep in path:
-                    # Circular dependency detected
-                    conflicts.append({
-                        'type': 'circular',
-                        'path': ' -> '.join(path + [dep]),
-                        'package': pkg_name
-                    })
+            while work:
+                node, deps = work[-1]
+                for dep in deps:
+                    if dep not in index:
+                        index[dep] = lowlink[dep] = len(index)
+                        stack.append(dep)
+                        on_stack.add(dep)
+                        work.append((dep, iter(dependency_graph.get(dep, ()))))
+                        break
+                    if dep in on_stack:
+                        lowlink[node] = min(lowlink[node], index[dep])
                 else:
-                    dfs(dep, path + [dep])
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    
+                    if lowlink[node] == index[node]:
+                        members = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            scc_of[member] = len(sccs)
+                            members.append(member)
+                            if member == node:
+                                break
+                        sccs.append(members)
+        
+        # Tarjan emits components in reverse topological order, so every
+        # dependency component is finished before the ones that need it
+        no_cycles: FrozenSet[int] = frozenset()
+        scc_cycles: List[FrozenSet[int]] = []
+        cycle_paths: Dict[int, str] = {}
+        for scc_id, members in enumerate(sccs):
+            cyclic = len(members) > 1 or members[0] in dependency_graph.get(members[0], ())
+            reachable = {scc_id} if cyclic else set()
+            for member in members:
+                for dep in dependency_graph.get(member, ()):
+                    dep_scc = scc_of[dep]
+                    if dep_scc != scc_id:
+                        reachable.update(scc_cycles[dep_scc])
+            scc_cycles.append(frozenset(reachable) if reachable else no_cycles)
+            if cyclic:
+                cycle_paths[scc_id] = self._cycle_path(members, dependency_graph)
         
-        dfs(pkg_name, [pkg_name])
-        return conflicts
+        self._scc_of = scc_of
+        self._scc_members = sccs
+        self._scc_cycles = scc_cycles
+        self._cycle_paths = cycle_paths
+    
+    @staticmethod
+    def _cycle_path(members: List[str], dependency_graph: Dict[str, Set[str]]) -> str:
+        """Walk edges inside a cyclic component until a node repeats and render that cycle."""
+        inside = set(members)
+        path = [min(members)]
+        position = {path[0]: 0}
+        while True:
+            nxt = min(dep for dep in dependency_graph.get(path[-1], ()) if dep in inside)
+            if nxt in position:
+                return ' -> '.join(path[position[nxt]:] + [nxt])
+            position[nxt] = len(path)
+            path.append(nxt)
+    
+    def _find_conflicts_for_package(self, pkg_name: str) -> List[Dict[str, str]]:
+        """
+        Find dependency conflicts for a package.
+        
+        Args:
+            pkg_name: Package name
+            
+        Returns:
+            List of conflict descriptions, one per dependency cycle the package reaches
+        """
+        scc_id = self._scc_of.get(pkg_name)
+        if scc_id is None:
+            return []
+        
+        return [
+            {
+                'type': 'circular',
+                'path': self._cycle_paths[cycle_id],
+                'members': ', '.join(sorted(self._scc_members[cycle_id])),
+                'package': pkg_name
+            }
+            for cycle_id in sorted(self._scc_cycles[scc_id])
+        ]
     
     def generate_report(self, 
                        format: str = "text",
@@ -577,8 +1074,96 @@ class VersionChecker:
         lines.append("")
         
         # Summary
-        total = len(self.results)
-        compatible = sum(1 for r in self.results if r.status == CompatibilityStatus.COMPATIBLE)
-        incompatible = sum(1 for r in self.results if r.status == CompatibilityStatus.INCOMPATIBLE)
-        conflicts = sum(1 for r in self.results if r.status == CompatibilityStatus.CONFLICT)
-        unknown = sum(1 for r in self.results if
\ No newline at end of file
+        summary = self._summary_counts()
+        lines.append("SUMMARY")
+        lines.append("-" * 80)
+        lines.append(f"Total packages checked: {summary['total']}")
+        lines.append(f"Compatible: {summary['compatible']}")
+        lines.append(f"Incompatible: {summary['incompatible']}")
+        lines.append(f"Conflicts: {summary['conflicts']}")
+        lines.append(f"Unknown: {summary['unknown']}")
+        lines.append("")
+        
+        # Details
+        lines.append("DETAILS")
+        lines.append("-" * 80)
+        for result in self.results:
+            lines.append(f"[{_STATUS_STR[result.status].upper()}] {result.package.name}")
+            lines.append(f"  {result.message}")
+            if result.required_specifier:
+                lines.append(f"  Required: {result.required_specifier}")
+            if result.installed_version:
+                lines.append(f"  Installed: {result.installed_version}")
+            for conflict in result.conflicts:
+                lines.append(f"  Conflict ({conflict['type']}): {conflict['path']}")
+            if result.available_versions:
+                lines.append(f"  Latest available: {', '.join(result.available_versions[-5:])}")
+        
+        lines.append("=" * 80)
+        return "\n".join(lines)
+    
+    def _summary_counts(self) -> Dict[str, int]:
+        """Count results per status in a single pass over the results."""
+        counts = Counter(r.status for r in self.results)
+        return {
+            'total': len(self.results),
+            'compatible': counts[CompatibilityStatus.COMPATIBLE],
+            'incompatible': counts[CompatibilityStatus.INCOMPATIBLE],
+            'conflicts': counts[CompatibilityStatus.CONFLICT],
+            'unknown': counts[CompatibilityStatus.UNKNOWN],
+            'warnings': counts[CompatibilityStatus.WARNING],
+        }
+    
+    def _report_data(self) -> Dict[str, Any]:
+        """Build the report structure shared by the JSON and YAML formats."""
+        return {
+            'generated': datetime.now().isoformat(),
+            'python': sys.version,
+            'platform': sys.platform,
+            'summary': self._summary_counts(),
+            'results': [result.to_dict() for result in self.results],
+        }
+    
+    def _generate_json_report(self) -> str:
+        """Generate JSON format report."""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(self._report_data(), option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(self._report_data(), indent=2)
+    
+    def _generate_yaml_report(self) -> str:
+        """Generate YAML format report."""
+        import yaml
+        
+        return yaml.safe_dump(self._report_data(), sort_keys=False)
+    
+    def _generate_markdown_report(self) -> str:
+        """Generate Markdown format report."""
+        summary = self._summary_counts()
+        lines = [
+            "# Python Package Compatibility Report",
+            "",
+            f"Generated: {datetime.now().isoformat()}  ",
+            f"Python: {sys.version.split()[0]} on {sys.platform}",
+            "",
+            "## Summary",
+            "",
+            "| Status | Count |",
+            "|--------|-------|",
+            f"| Compatible | {summary['compatible']} |",
+            f"| Incompatible | {summary['incompatible']} |",
+            f"| Conflicts | {summary['conflicts']} |",
+            f"| Unknown | {summary['unknown']} |",
+            f"| **Total** | **{summary['total']}** |",
+            "",
+            "## Details",
+            "",
+            "| Package | Status | Required | Installed | Message |",
+            "|---------|--------|----------|-----------|---------|",
+        ]
+        for result in self.results:
+            lines.append(
+                f"| {result.package.name} | {_STATUS_STR[result.status]} | "
+                f"{result.required_specifier or '-'} | {result.installed_version or '-'} | "
+                f"{result.message} |"
+            )
+        return "\n".join(lines) + "\n"
@@ -22,22 +22,32 @@ Examples:
 """
 
 import argparse
+import ast
+import asyncio
+import gzip
 import re
 import sys
 import os
 import subprocess
 import json
-import tempfile
 import hashlib
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Set, Any
+from collections import deque
+from typing import Dict, Iterator, List, NamedTuple, Tuple, Optional, Set, Any
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 import urllib.request
 import urllib.error
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(
@@ -77,30 +87,82 @@ class Requirement:
     line_number: int = 0
 
 
+class PackageTokens(NamedTuple):
+    """Fields of a package line as split by RequirementsFixer._parse_package_fast."""
+    editable: bool
+    package_name: str
+    extras: Optional[Tuple[str, ...]]
+    version_spec: Optional[str]
+    markers: Optional[str]
+    hash_options: Optional[Tuple[str, ...]]
+    comment: Optional[str]
+
+
+class ParsedLine(NamedTuple):
+    """Line-number-independent parse of a requirements line; immutable so it can be cached and shared."""
+    cleaned: str
+    line_type: RequirementType
+    package_name: Optional[str] = None
+    version_spec: Optional[str] = None
+    extras: Optional[Tuple[str, ...]] = None
+    markers: Optional[str] = None
+    hash_options: Optional[Tuple[str, ...]] = None
+    index_url: Optional[str] = None
+    trusted_host: Optional[str] = None
+    comment: Optional[str] = None
+    unparseable: bool = False
+
+
+# Characters allowed after the first one in a PEP 503 project name
+_NAME_CHARS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._-')
+
+
 class RequirementsFixer:
     """Main class for fixing and validating requirements.txt files."""
     
-    # Regex patterns for parsing requirements
-    PACKAGE_PATTERN = re.compile(
-        r'^(?P<editable>-e\s+)?'
-        r'(?P<package>[a-zA-Z0-9][a-zA-Z0-9._-]*)'
-        r'(?P<extras>\[[^\]]+\])?'
-        r'(?P<version_spec>\s*(?:[=<>!~]=?|===)\s*[^;\s]+)?'
-        r'(?P<markers>\s*;\s*[^#]+)?'
-        r'(?P<hash_options>\s*--hash=[^#\s]+(?:\s+--hash=[^#\s]+)*)?'
-        r'(?P<comment>\s*#.*)?$'
-    )
+    # Regex patterns for parsing requirements; package lines themselves are
+    # split by _parse_package_fast, which only needs this for the operator
+    VERSION_SPEC_PATTERN = re.compile(r'(?:===|[=<>!~]=?)\s*[^;\s]+')
     
     INDEX_URL_PATTERN = re.compile(r'^-i\s+|^--index-url\s+', re.IGNORECASE)
     EXTRA_INDEX_PATTERN = re.compile(r'^--extra-index-url\s+', re.IGNORECASE)
     TRUSTED_HOST_PATTERN = re.compile(r'^--trusted-host\s+', re.IGNORECASE)
     OPTION_PATTERN = re.compile(r'^--(?!hash|index-url|extra-index-url|trusted-host)')
     CONSTRAINT_PATTERN = re.compile(r'^-c\s+|^--constraint\s+', re.IGNORECASE)
+    WHITESPACE_PATTERN = re.compile(r'\s+')
+    # Whitespace-separated --hash= options trailing a package line
+    HASH_OPTION_PATTERN = re.compile(r'\s+--hash=')
+    
+    # name = "..." in setup.py / pyproject.toml of editable installs
+    PROJECT_NAME_PATTERN = re.compile(r'name\s*=\s*[\'"]([^\'"]+)[\'"]')
+    
+    # Below this many files, worker process startup costs more than parsing saves
+    PARALLEL_IMPORT_MIN_FILES = 64
+    
+    # import a, b / from a.b import c
+    IMPORT_PATTERNS = (
+        re.compile(r'^\s*import\s+([a-zA-Z0-9_]+(?:\s*,\s*[a-zA-Z0-9_]+)*)'),
+        re.compile(r'^\s*from\s+([a-zA-Z0-9_.]+)\s+import'),
+    )
     
     # PyPI API endpoints
     PYPI_API_URL = "https://pypi.org/pypi/{package}/json"
     PYPI_SEARCH_URL = "https://pypi.org/search/?q={query}"
     
+    # On-disk PyPI cache; entries younger than the TTL skip the network, older
+    # ones are revalidated with their ETag. Per user, since pin_versions trusts it
+    PYPI_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'ai-scanner' / 'reqfix'
+    PYPI_CACHE_TTL = 6 * 60 * 60
+    
+    # Simple repository index listing every project name (PEP 503/691). It is
+    # tens of MB, so existence-only checks use it once a file has enough
+    # packages to beat per-package requests, or while a cached copy is fresh
+    PYPI_SIMPLE_INDEX_URL = "https://pypi.org/simple/"
+    SIMPLE_INDEX_TTL = 60 * 60
+    SIMPLE_INDEX_MIN_PACKAGES = 200
+    SIMPLE_INDEX_ANCHOR_PATTERN = re.compile(r'<a [^>]*>([^<]+)</a>')
+    NAME_NORMALIZE_PATTERN = re.compile(r'[-_.]+')
+    
     def __init__(self, input_file: str, output_file: Optional[str] = None):
         self.input_file = Path(input_file)
         self.output_file = Path(output_file) if output_file else self.input_file
@@ -117,124 +179,176 @@ class RequirementsFixer:
             
         logger.info(f"Parsing {self.input_file}")
         
-        with open(self.input_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-            
-        for i, line in enumerate(lines, 1):
-            requirement = self._parse_line(line.strip(), i)
-            self.requirements.append(requirement)
+        # Stream the file through a 1 MiB buffer instead of materializing all lines first
+        with open(self.input_file, 'r', encoding='utf-8', buffering=1 << 20) as f:
+            self.requirements.extend(
+                self._parse_line(line.rstrip('\r\n'), i) for i, line in enumerate(f, 1)
+            )
             
         logger.info(f"Parsed {len(self.requirements)} lines")
         return True
         
     def _parse_line(self, line: str, line_number: int) -> Requirement:
-        """Parse a single line from requirements.txt."""
-        original = line
+        """Parse a single line from requirements.txt; the original keeps its indentation."""
+        parsed = self._classify_line(line.strip())
+        
+        if parsed.unparseable:
+            self.warnings.append(f"Line {line_number}: Could not parse line, treating as comment: {line}")
+            
+        package_name = parsed.package_name
+        cleaned = parsed.cleaned
+        
+        # Extract package name from path for editable installs; depends on the
+        # filesystem, so it stays outside the cached parse
+        if parsed.line_type == RequirementType.EDITABLE and package_name and \
+                ('/' in package_name or '\\' in package_name):
+            # Try to get package name from setup.py or pyproject.toml
+            package_name = self._extract_package_name_from_path(package_name)
+            cleaned = cleaned.replace(parsed.package_name, package_name, 1)
+            
+        return Requirement(
+            original=line,
+            cleaned=cleaned,
+            line_type=parsed.line_type,
+            package_name=package_name,
+            version_spec=parsed.version_spec,
+            extras=list(parsed.extras) if parsed.extras else None,
+            markers=parsed.markers,
+            hash_options=list(parsed.hash_options) if parsed.hash_options else None,
+            index_url=parsed.index_url,
+            trusted_host=parsed.trusted_host,
+            comment=parsed.comment,
+            line_number=line_number
+        )
+        
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _classify_line(line: str) -> ParsedLine:
+        """Parse a line's content; regenerated files repeat lines, so results are cached."""
+        cls = RequirementsFixer
         
         # Check for empty lines
         if not line or line.isspace():
-            return Requirement(original, line, RequirementType.EMPTY, line_number=line_number)
+            return ParsedLine(line, RequirementType.EMPTY)
             
         # Check for comments
         if line.startswith('#'):
-            return Requirement(original, line, RequirementType.COMMENT, comment=line, line_number=line_number)
+            return ParsedLine(line, RequirementType.COMMENT, comment=line)
             
         # Check for index URLs
-        if self.INDEX_URL_PATTERN.match(line):
-            url = self.INDEX_URL_PATTERN.sub('', line).strip()
-            return Requirement(original, line, RequirementType.INDEX_URL, index_url=url, line_number=line_number)
+        if cls.INDEX_URL_PATTERN.match(line):
+            url = cls.INDEX_URL_PATTERN.sub('', line).strip()
+            return ParsedLine(line, RequirementType.INDEX_URL, index_url=url)
             
         # Check for extra index URLs
-        if self.EXTRA_INDEX_PATTERN.match(line):
-            url = self.EXTRA_INDEX_PATTERN.sub('', line).strip()
-            return Requirement(original, line, RequirementType.EXTRA_INDEX, index_url=url, line_number=line_number)
+        if cls.EXTRA_INDEX_PATTERN.match(line):
+            url = cls.EXTRA_INDEX_PATTERN.sub('', line).strip()
+            return ParsedLine(line, RequirementType.EXTRA_INDEX, index_url=url)
             
         # Check for trusted hosts
-        if self.TRUSTED_HOST_PATTERN.match(line):
-            host = self.TRUSTED_HOST_PATTERN.sub('', line).strip()
-            return Requirement(original, line, RequirementType.TRUSTED_HOST, trusted_host=host, line_number=line_number)
+        if cls.TRUSTED_HOST_PATTERN.match(line):
+            host = cls.TRUSTED_HOST_PATTERN.sub('', line).strip()
+            return ParsedLine(line, RequirementType.TRUSTED_HOST, trusted_host=host)
             
         # Check for constraints
-        if self.CONSTRAINT_PATTERN.match(line):
-            constraint = self.CONSTRAINT_PATTERN.sub('', line).strip()
-            return Requirement(original, line, RequirementType.CONSTRAINT, comment=constraint, line_number=line_number)
+        if cls.CONSTRAINT_PATTERN.match(line):
+            constraint = cls.CONSTRAINT_PATTERN.sub('', line).strip()
+            return ParsedLine(line, RequirementType.CONSTRAINT, comment=constraint)
             
         # Check for other options
-        if self.OPTION_PATTERN.match(line):
-            return Requirement(original, line, RequirementType.OPTION, line_number=line_number)
+        if cls.OPTION_PATTERN.match(line):
+            return ParsedLine(line, RequirementType.OPTION)
             
         # Try to parse as a package
-        match = self.PACKAGE_PATTERN.match(line)
-        if match:
-            groups = match.groupdict()
-            package_name = groups['package']
-            
-            # Handle editable packages
-            if groups['editable']:
-                line_type = RequirementType.EDITABLE
-                # Extract package name from path for editable installs
-                if '/' in package_name or '\\' in package_name:
-                    # Try to get package name from setup.py or pyproject.toml
-                    package_name = self._extract_package_name_from_path(package_name)
-            else:
-                line_type = RequirementType.PACKAGE
-                
-            # Parse extras
-            extras = None
-            if groups['extras']:
-                extras_text = groups['extras'][1:-1]  # Remove brackets
-                extras = [extra.strip() for extra in extras_text.split(',')]
-                
-            # Parse markers
-            markers = groups['markers'].strip() if groups['markers'] else None
-            
-            # Parse hash options
-            hash_options = None
-            if groups['hash_options']:
-                hash_options = [h.strip() for h in groups['hash_options'].split() if h.startswith('--hash=')]
-                
-            # Parse comment
-            comment = groups['comment'].strip() if groups['comment'] else None
-            
-            # Clean version (remove extra spaces)
-            version_spec = groups['version_spec'].strip() if groups['version_spec'] else None
-            if version_spec:
-                version_spec = re.sub(r'\s+', ' ', version_spec)
-                
+        tokens = cls._parse_package_fast(line)
+        if tokens:
             # Create cleaned version
             cleaned_parts = []
-            if groups['editable']:
+            if tokens.editable:
                 cleaned_parts.append('-e')
-            cleaned_parts.append(package_name)
-            if extras:
-                cleaned_parts.append(f"[{','.join(extras)}]")
-            if version_spec:
-                cleaned_parts.append(version_spec)
-            if markers:
-                cleaned_parts.append(f";{markers}")
-            if hash_options:
-                cleaned_parts.extend(hash_options)
-            if comment:
-                cleaned_parts.append(comment)
+            cleaned_parts.append(tokens.package_name)
+            if tokens.extras:
+                cleaned_parts.append(f"[{','.join(tokens.extras)}]")
+            if tokens.version_spec:
+                cleaned_parts.append(tokens.version_spec)
+            if tokens.markers:
+                cleaned_parts.append(f";{tokens.markers}")
+            if tokens.hash_options:
+                cleaned_parts.extend(tokens.hash_options)
+            if tokens.comment:
+                cleaned_parts.append(tokens.comment)
                 
-            cleaned = ' '.join(cleaned_parts)
-            
-            return Requirement(
-                original=original,
-                cleaned=cleaned,
-                line_type=line_type,
-                package_name=package_name,
-                version_spec=version_spec,
-                extras=extras,
-                markers=markers,
-                hash_options=hash_options,
-                comment=comment,
-                line_number=line_number
+            return ParsedLine(
+                cleaned=' '.join(cleaned_parts),
+                line_type=RequirementType.EDITABLE if tokens.editable else RequirementType.PACKAGE,
+                package_name=tokens.package_name,
+                version_spec=tokens.version_spec,
+                extras=tokens.extras,
+                markers=tokens.markers,
+                hash_options=tokens.hash_options,
+                comment=tokens.comment
             )
             
         # If we get here, it's an unparseable line - treat as comment
-        self.warnings.append(f"Line {line_number}: Could not parse line, treating as comment: {line}")
-        return Requirement(original, f"# {line}", RequirementType.COMMENT, comment=line, line_number=line_number)
+        return ParsedLine(f"# {line}", RequirementType.COMMENT, comment=line, unparseable=True)
+        
+    @staticmethod
+    def _parse_package_fast(line: str) -> Optional[PackageTokens]:
+        """
+        Split a package line into its parts with plain string operations.
+        
+        Handles ``[-e] name[extras] [spec] [; markers] [--hash=...] [# comment]``
+        and returns None when the line does not have that shape.
+        """
+        rest = line
+        
+        editable = rest.startswith('-e') and rest[2:3].isspace()
+        if editable:
+            rest = rest[2:].lstrip()
+            
+        rest, has_comment, comment_text = rest.partition('#')
+        comment = f"#{comment_text}".strip() if has_comment else None
+        
+        rest, *hashes = RequirementsFixer.HASH_OPTION_PATTERN.split(rest) if '--hash=' in rest else (rest,)
+        hash_options = None
+        if hashes:
+            hash_options = []
+            for value in hashes:
+                value = value.strip()
+                if not value or any(c.isspace() for c in value):
+                    return None
+                hash_options.append(f"--hash={value}")
+            hash_options = tuple(hash_options)
+                
+        rest, has_markers, markers_text = rest.partition(';')
+        markers = markers_text.strip() if has_markers else None
+        if has_markers and not markers:
+            return None
+            
+        # Project name: an alphanumeric followed by name characters
+        if not rest or not rest[0].isalnum() or not rest[0].isascii():
+            return None
+        end = 1
+        while end < len(rest) and rest[end] in _NAME_CHARS:
+            end += 1
+        package_name = rest[:end]
+        
+        extras = None
+        if rest[end:end + 1] == '[':
+            close = rest.find(']', end)
+            if close <= end + 1:
+                return None
+            extras = tuple(extra.strip() for extra in rest[end + 1:close].split(','))
+            end = close + 1
+            
+        version_spec = rest[end:].strip() or None
+        if version_spec:
+            if not RequirementsFixer.VERSION_SPEC_PATTERN.fullmatch(version_spec):
+                return None
+            # Clean version (remove extra spaces)
+            version_spec = RequirementsFixer.WHITESPACE_PATTERN.sub(' ', version_spec)
+            
+        return PackageTokens(editable, package_name, extras, version_spec, markers, hash_options, comment)
         
     def _extract_package_name_from_path(self, path: str) -> str:
         """Extract package name from a local path for editable installs."""
@@ -247,7 +361,7 @@ class RequirementsFixer:
                 with open(setup_py, 'r') as f:
                     content = f.read()
                     # Simple regex to find name in setup()
-                    name_match = re.search(r'name\s*=\s*[\'"]([^\'"]+)[\'"]', content)
+                    name_match = self.PROJECT_NAME_PATTERN.search(content)
                     if name_match:
                         return name_match.group(1)
             except Exception:
@@ -260,7 +374,7 @@ class RequirementsFixer:
                 with open(pyproject_toml, 'r') as f:
                     content = f.read()
                     # Simple regex to find project.name
-                    name_match = re.search(r'name\s*=\s*[\'"]([^\'"]+)[\'"]', content)
+                    name_match = self.PROJECT_NAME_PATTERN.search(content)
                     if name_match:
                         return name_match.group(1)
             except Exception:
@@ -269,9 +383,15 @@ class RequirementsFixer:
         # Fallback to directory name
         return path_obj.name
         
-    def validate_packages(self, max_workers: int = 10) -> bool:
-        """Validate packages against PyPI API."""
-        packages = [req for req in self.requirements if req.line_type == RequirementType.PACKAGE]
+    def validate_packages(self, max_workers: int = 64, fetch_versions: bool = True) -> bool:
+        """
+        Validate packages against PyPI API.
+        
+        With fetch_versions=False only existence is checked (no latest versions
+        for pin_versions), which a single simple-index download can answer.
+        """
+        packages = [req for req in self.requirements
+                    if req.line_type == RequirementType.PACKAGE and req.package_name]
         
         if not packages:
             logger.info("No packages to validate")
@@ -279,45 +399,120 @@ class RequirementsFixer:
             
         logger.info(f"Validating {len(packages)} packages against PyPI...")
         
-        # Use ThreadPoolExecutor for concurrent validation
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(self._validate_package, req.package_name): req 
-                for req in packages if req.package_name
-            }
-            
-            for future in as_completed(futures):
-                req = futures[future]
-                try:
-                    result = future.result()
-                    if result:
-                        latest_version, is_valid = result
-                        if is_valid:
-                            self.package_versions[req.package_name] = latest_version
-                        else:
-                            self.errors.append(f"Package not found on PyPI: {req.package_name}")
-                    else:
-                        self.warnings.append(f"Could not validate package: {req.package_name}")
-                except Exception as e:
-                    self.warnings.append(f"Error validating {req.package_name}: {str(e)}")
+        if not fetch_versions:
+            simple_index = self._fetch_simple_index(len(packages))
+            if simple_index is not None:
+                for req in packages:
+                    if self._normalize_name(req.package_name) not in simple_index:
+                        self.errors.append(f"Package not found on PyPI: {req.package_name}")
+                return len(self.errors) == 0
+        
+        # All lookups run concurrently on one event loop
+        results = asyncio.run(self._validate_all([req.package_name for req in packages], max_workers))
+        
+        for req, result in zip(packages, results):
+            if isinstance(result, Exception):
+                self.warnings.append(f"Error validating {req.package_name}: {str(result)}")
+            elif result:
+                latest_version, is_valid = result
+                if is_valid:
+                    self.package_versions[req.package_name] = latest_version
+                else:
+                    self.errors.append(f"Package not found on PyPI: {req.package_name}")
+            else:
+                self.warnings.append(f"Could not validate package: {req.package_name}")
                     
         return len(self.errors) == 0
         
+    async def _validate_all(self, package_names: List[str], max_connections: int) -> List[Any]:
+        """Validate all packages concurrently, reusing pooled keep-alive connections to PyPI."""
+        if not AIOHTTP_AVAILABLE:
+            # urllib has no connection pool; bound the blocking lookups instead
+            semaphore = asyncio.Semaphore(max_connections)
+            
+            async def validate(package_name: str) -> Optional[Tuple[str, bool]]:
+                async with semaphore:
+                    return await asyncio.to_thread(self._validate_package, package_name)
+                    
+            return await asyncio.gather(*(validate(name) for name in package_names), return_exceptions=True)
+            
+        connector = aiohttp.TCPConnector(limit=max_connections, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(
+            connector=connector,
+            headers={'User-Agent': 'RequirementsFixer/1.0', 'Accept-Encoding': 'gzip'},
+            timeout=aiohttp.ClientTimeout(total=10)
+        ) as session:
+            return await asyncio.gather(
+                *(self._validate_package_async(session, name) for name in package_names),
+                return_exceptions=True
+            )
+            
+    async def _validate_package_async(self, session: 'aiohttp.ClientSession',
+                                      package_name: str) -> Optional[Tuple[str, bool]]:
+        """Validate a single package against PyPI over a shared aiohttp session."""
+        cache_path = self.PYPI_CACHE_DIR / f"{package_name.lower()}.json"
+        cached = self._read_pypi_cache(cache_path)
+        if cached and time.time() - cached['mtime'] < self.PYPI_CACHE_TTL:
+            return (cached['version'], True)
+            
+        try:
+            url = self.PYPI_API_URL.format(package=package_name.lower())
+            headers = {}
+            if cached and cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+                
+            async with session.get(url, headers=headers) as response:
+                if response.status == 304 and cached:
+                    # Unchanged since the cached response; restart its TTL
+                    self._write_pypi_cache(cache_path, cached['version'], cached.get('etag'))
+                    return (cached['version'], True)
+                if response.status == 404:
+                    return (None, False)
+                if response.status != 200:
+                    logger.warning(f"HTTP error for {package_name}: {response.status}")
+                    return None
+                data = json.loads(await response.read())
+                etag = response.headers.get('ETag')
+                
+            if 'info' in data and 'version' in data['info']:
+                latest_version = data['info']['version']
+                self._write_pypi_cache(cache_path, latest_version, etag)
+                return (latest_version, True)
+                
+        except Exception as e:
+            logger.warning(f"Error validating {package_name}: {str(e)}")
+            
+        return None
+        
     def _validate_package(self, package_name: str) -> Optional[Tuple[str, bool]]:
         """Validate a single package against PyPI."""
+        cache_path = self.PYPI_CACHE_DIR / f"{package_name.lower()}.json"
+        cached = self._read_pypi_cache(cache_path)
+        if cached and time.time() - cached['mtime'] < self.PYPI_CACHE_TTL:
+            return (cached['version'], True)
+            
         try:
             url = self.PYPI_API_URL.format(package=package_name.lower())
-            request = urllib.request.Request(url, headers={'User-Agent': 'RequirementsFixer/1.0'})
+            headers = {'User-Agent': 'RequirementsFixer/1.0'}
+            if cached and cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            request = urllib.request.Request(url, headers=headers)
             
             with urllib.request.urlopen(request, timeout=10) as response:
                 data = json.loads(response.read().decode('utf-8'))
+                etag = response.headers.get('ETag')
                 
             if 'info' in data and 'version' in data['info']:
                 latest_version = data['info']['version']
+                self._write_pypi_cache(cache_path, latest_version, etag)
                 return (latest_version, True)
                 
         except urllib.error.HTTPError as e:
-            if e.code == 404:
+            if e.code == 304 and cached:
+                # Unchanged since the cached response; restart its TTL
+                self._write_pypi_cache(cache_path, cached['version'], cached.get('etag'))
+                return (cached['version'], True)
+            elif e.code == 404:
                 return (None, False)
             else:
                 logger.warning(f"HTTP error for {package_name}: {e.code}")
@@ -326,6 +521,93 @@ class RequirementsFixer:
             
         return None
         
+    @classmethod
+    def _normalize_name(cls, name: str) -> str:
+        """Normalize a project name as PEP 503 does."""
+        return cls.NAME_NORMALIZE_PATTERN.sub('-', name).lower()
+        
+    def _fetch_simple_index(self, package_count: int) -> Optional[Set[str]]:
+        """
+        Get the normalized names of all PyPI projects from the simple index.
+        
+        Returns None when per-package lookups are cheaper (small file and no
+        fresh cached index) or the index cannot be fetched.
+        """
+        cache_path = self.PYPI_CACHE_DIR / "simple-index.json"
+        cached = None
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            age = time.time() - cache_path.stat().st_mtime
+        except (OSError, ValueError):
+            age = None
+            
+        if cached and age is not None and age < self.SIMPLE_INDEX_TTL:
+            return set(cached['projects'])
+        if package_count < self.SIMPLE_INDEX_MIN_PACKAGES:
+            return None
+            
+        headers = {
+            'User-Agent': 'RequirementsFixer/1.0',
+            'Accept': 'application/vnd.pypi.simple.v1+json, text/html;q=0.1',
+            'Accept-Encoding': 'gzip',
+        }
+        if cached and cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+            
+        try:
+            request = urllib.request.Request(self.PYPI_SIMPLE_INDEX_URL, headers=headers)
+            with urllib.request.urlopen(request, timeout=60) as response:
+                body = response.read()
+                if response.headers.get('Content-Encoding') == 'gzip':
+                    body = gzip.decompress(body)
+                content_type = response.headers.get('Content-Type', '')
+                etag = response.headers.get('ETag')
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and cached:
+                cache_path.touch()
+                return set(cached['projects'])
+            logger.warning(f"HTTP error for simple index: {e.code}")
+            return None
+        except Exception as e:
+            logger.warning(f"Error fetching simple index: {str(e)}")
+            return None
+            
+        if 'json' in content_type:
+            names = [project['name'] for project in json.loads(body)['projects']]
+        else:
+            # PEP 503 HTML: one anchor per project
+            names = self.SIMPLE_INDEX_ANCHOR_PATTERN.findall(body.decode('utf-8'))
+        projects = sorted({self._normalize_name(name) for name in names})
+        
+        try:
+            cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump({'etag': etag, 'projects': projects}, f)
+        except OSError as e:
+            logger.debug(f"Could not write simple index cache {cache_path}: {e}")
+            
+        return set(projects)
+        
+    def _read_pypi_cache(self, cache_path: Path) -> Optional[Dict[str, Any]]:
+        """Load a cached PyPI response (version, etag) along with its age."""
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            cached['mtime'] = cache_path.stat().st_mtime
+        except (OSError, ValueError):
+            return None
+        return cached if cached.get('version') else None
+        
+    def _write_pypi_cache(self, cache_path: Path, version: str, etag: Optional[str]) -> None:
+        """Persist the latest version and ETag of a package; failures only cost a refetch."""
+        try:
+            cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': version, 'etag': etag}, f)
+        except OSError as e:
+            logger.debug(f"Could not write PyPI cache {cache_path}: {e}")
+            
     def remove_duplicates(self) -> None:
         """Remove duplicate package entries."""
         seen_packages: Set[str] = set()
@@ -412,17 +694,12 @@ class RequirementsFixer:
         logger.info(f"Analyzing imports in {project_path}")
         
         # Find all Python files
-        python_files = list(project_dir.rglob("*.py"))
+        python_files = list(_iter_py_files(str(project_dir)))
         
         if not python_files:
             self.warnings.append(f"No Python files found in {project_path}")
             return {}
             
-        import_patterns = [
-            re.compile(r'^\s*import\s+([a-zA-Z0-9_]+(?:\s*,\s*[a-zA-Z0-9_]+)*)'),
-            re.compile(r'^\s*from\s+([a-zA-Z0-9_.]+)\s+import'),
-        ]
-        
         used_packages: Set[str] = set()
         module_to_package: Dict[str, str] = {}
         
@@ -446,6 +723,95 @@ class RequirementsFixer:
         module_to_package.update(common_mappings)
         
         # Analyze each Python file
-        for py_file in python_files:
-            try:
-                with open(py_file, 'r', encoding='utf-8
\ No newline at end of file
+        if len(python_files) >= self.PARALLEL_IMPORT_MIN_FILES:
+            # AST parsing holds the GIL, so spread files over processes
+            workers = os.cpu_count() or 1
+            chunksize = max(1, len(python_files) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                file_results = list(executor.map(_parse_imports_or_error, python_files, chunksize=chunksize))
+        else:
+            file_results = [_parse_imports_or_error(py_file) for py_file in python_files]
+            
+        for py_file, (modules, error) in zip(python_files, file_results):
+            if error:
+                self.warnings.append(f"Could not read {py_file}: {error}")
+                continue
+            for module in modules:
+                if module in module_to_package:
+                    used_packages.add(module_to_package[module])
+                
+        # Declared packages that no file imports
+        used_lower = {name.lower() for name in used_packages}
+        unused_packages = {
+            req.package_name for req in self.requirements
+            if req.line_type == RequirementType.PACKAGE and req.package_name
+            and req.package_name.lower() not in used_lower
+        }
+        for package_name in sorted(unused_packages):
+            self.warnings.append(f"Package not imported in {project_path}: {package_name}")
+            
+        logger.info(f"Found {len(used_packages)} used and {len(unused_packages)} unused packages")
+        return {'used': used_packages, 'unused': unused_packages}
+
+
+# Directories that never hold the project's own imports
+_SKIP_DIRS = frozenset({'__pycache__', '.git', '.venv', 'node_modules'})
+
+
+def _iter_py_files(root: str) -> Iterator[str]:
+    """Yield paths of all .py files under root, breadth-first, using cached scandir entry types."""
+    pending = deque([root])
+    while pending:
+        directory = pending.popleft()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _SKIP_DIRS:
+                            pending.append(entry.path)
+                    elif entry.name.endswith('.py') and entry.is_file():
+                        yield entry.path
+        except OSError:
+            continue
+
+
+def _parse_imports_in_file(path: str) -> Set[str]:
+    """
+    Collect the lowercased top-level modules a Python file imports.
+    
+    Uses the AST, so multi-line imports count and strings or comments do not;
+    falls back to the line regexes for files that are not valid Python 3.
+    Relative imports name local modules and are skipped.
+    """
+    with open(path, 'rb') as f:
+        source = f.read()
+    modules: Set[str] = set()
+    
+    try:
+        tree = ast.parse(source, filename=str(path))
+    except (SyntaxError, ValueError):
+        for line in source.decode('utf-8', errors='ignore').splitlines():
+            for pattern in RequirementsFixer.IMPORT_PATTERNS:
+                match = pattern.match(line)
+                if match:
+                    modules.update(m.strip().split('.')[0].lower() for m in match.group(1).split(','))
+                    break
+        modules.discard('')  # "from . import x"
+        return modules
+        
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.update(alias.name.split('.')[0].lower() for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            modules.add(node.module.split('.')[0].lower())
+            
+    return modules
+
+
+def _parse_imports_or_error(path: str) -> Tuple[Set[str], Optional[str]]:
+    """Run _parse_imports_in_file, returning any error so one bad file cannot abort a pool map."""
+    try:
+        return _parse_imports_in_file(path), None
+    except Exception as e:
+        # Read errors, but also RecursionError/MemoryError from ast.parse on pathological sources
+        return set(), str(e) or type(e).__name__
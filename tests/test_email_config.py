@@ -0,0 +1,58 @@
+"""
+Tests for email configuration loading and overrides.
+Covers the legacy use_tls/use_ssl flags and override cache keys.
+"""
+
+import pytest
+
+from config.email_config import EmailConfigManager, EmailSecurity, get_email_config
+
+
+class TestLegacySecurityOverrides:
+    """Test that legacy TLS/SSL flags survive model validation."""
+
+    def test_load_config_use_ssl(self):
+        """load_config(use_ssl=True) selects implicit SSL."""
+        config = EmailConfigManager().load_config(use_ssl=True)
+        assert config.smtp_security == EmailSecurity.SSL
+        assert config.use_ssl is True
+        assert config.use_tls is False
+
+    def test_set_override_use_ssl(self):
+        """A persistent use_ssl override applies to later loads."""
+        manager = EmailConfigManager()
+        manager.set_override("use_ssl", True)
+        config = manager.load_config()
+        assert config.smtp_security == EmailSecurity.SSL
+        assert config.use_ssl is True
+        assert config.use_tls is False
+
+    def test_load_config_flags_off(self):
+        """Turning both flags off means no transport security."""
+        config = EmailConfigManager().load_config(use_tls=False, use_ssl=False)
+        assert config.smtp_security == EmailSecurity.NONE
+
+    def test_load_config_conflicting_flags(self):
+        """Flags contradicting an explicit smtp_security are rejected."""
+        with pytest.raises(ValueError):
+            EmailConfigManager().load_config(smtp_security="ssl", use_tls=True)
+
+    def test_update_config_use_ssl(self):
+        """update_config keeps a legacy flag change."""
+        manager = EmailConfigManager()
+        manager.update_config(use_ssl=True, use_tls=False)
+        config = manager.get_config()
+        assert config.smtp_security == EmailSecurity.SSL
+        assert config.use_ssl is True
+
+
+class TestOverrideCacheKeys:
+    """Test caching of loads with unhashable override values."""
+
+    def test_get_email_config_dict_override(self):
+        """get_email_config accepts dict-valued overrides and keys the cache on their values."""
+        first = get_email_config(templates={"folder": "x"})
+        second = get_email_config(templates={"folder": "y"})
+        assert first.templates.folder == "x"
+        assert second.templates.folder == "y"
+        assert get_email_config(templates={"folder": "x"}) is first
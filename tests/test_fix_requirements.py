@@ -0,0 +1,106 @@
+"""
+Tests for the requirements.txt package-line tokenizer.
+Checks RequirementsFixer._parse_package_fast against the regex it replaced.
+"""
+
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from fix_requirements import RequirementsFixer  # noqa: E402
+
+
+# The package-line regex _parse_package_fast replaced, kept as the reference
+LEGACY_PACKAGE_PATTERN = re.compile(
+    r'^(?P<editable>-e\s+)?'
+    r'(?P<package>[a-zA-Z0-9][a-zA-Z0-9._-]*)'
+    r'(?P<extras>\[[^\]]+\])?'
+    r'(?P<version_spec>\s*(?:[=<>!~]=?|===)\s*[^;\s]+)?'
+    r'(?P<markers>\s*;\s*[^#]+)?'
+    r'(?P<hash_options>\s*--hash=[^#\s]+(?:\s+--hash=[^#\s]+)*)?'
+    r'(?P<comment>\s*#.*)?$'
+)
+
+
+def legacy_tokens(line):
+    """Fields the old parser derived from LEGACY_PACKAGE_PATTERN, or None when it did not match."""
+    match = LEGACY_PACKAGE_PATTERN.match(line)
+    if not match:
+        return None
+    groups = match.groupdict()
+
+    extras = None
+    if groups['extras']:
+        extras = tuple(extra.strip() for extra in groups['extras'][1:-1].split(','))
+
+    hash_options = None
+    if groups['hash_options']:
+        hash_options = tuple(h.strip() for h in groups['hash_options'].split() if h.startswith('--hash='))
+
+    # The old group kept the ';' separator, which the cleaned line then doubled
+    markers = groups['markers'].strip()[1:].strip() if groups['markers'] else None
+
+    version_spec = groups['version_spec'].strip() if groups['version_spec'] else None
+    if version_spec:
+        version_spec = re.sub(r'\s+', ' ', version_spec)
+
+    return (
+        bool(groups['editable']),
+        groups['package'],
+        extras,
+        version_spec,
+        markers,
+        hash_options,
+        groups['comment'].strip() if groups['comment'] else None,
+    )
+
+
+class TestParsePackageFast:
+    """Test the string tokenizer for package lines."""
+
+    @pytest.mark.parametrize("line", [
+        "requests",
+        "requests==2.31.0",
+        "requests >= 2.0",
+        "requests~=2.31",
+        "requests===2.31.0",
+        "requests!=2.30.0",
+        "Django<5.0",
+        "zope.interface>=5",
+        "backports_zoneinfo",
+        "uvicorn[standard]>=0.23",
+        "celery[redis, msgpack]==5.3.4",
+        "pywin32>=306; sys_platform == 'win32'",
+        "numpy>=1.24 ; python_version >= '3.9'",
+        "requests==2.31.0 # HTTP client",
+        "requests # pinned below",
+        "flask==3.0.0 --hash=sha256:aa",
+        "flask==3.0.0 --hash=sha256:aa --hash=sha256:bb",
+        "flask==3.0.0\t--hash=sha256:aa",
+        "flask==3.0.0 \t --hash=sha256:aa\t--hash=sha256:bb",
+        "flask==3.0.0 --hash=sha256:aa # locked",
+        "-e mypkg",
+        "-e mypkg>=1.0",
+    ])
+    def test_matches_legacy_pattern(self, line):
+        """Lines the old regex accepted split into the same fields."""
+        expected = legacy_tokens(line)
+        assert expected is not None
+        assert tuple(RequirementsFixer._parse_package_fast(line)) == expected
+
+    @pytest.mark.parametrize("line", [
+        "",
+        "-requests",
+        "requests[]",
+        "requests foo",
+        "requests==1.0 --hash=",
+        "requests;",
+    ])
+    def test_rejects_what_legacy_pattern_rejected(self, line):
+        """Lines the old regex rejected are not treated as packages."""
+        assert legacy_tokens(line) is None
+        assert RequirementsFixer._parse_package_fast(line) is None